@@ -1,5 +1,6 @@
-from typing import List, Dict, Any
-import yaml
+import os
+import sys
+from typing import List, Dict, Any, Tuple
 
 from tomo.shared.intent import Intent
 from tomo.shared.slots import Slot
@@ -7,6 +8,8 @@ from tomo.shared.slots import Slot
 
 # Policy configuration
 class PolicyConfig:
+    __slots__ = ("policy_type", "kwargs")
+
     def __init__(self, policy_type: str, **kwargs):
         self.policy_type = policy_type
         self.kwargs = kwargs  # Store other policy-specific fields dynamically
@@ -14,6 +17,8 @@ class PolicyConfig:
 
 # NLU configuration
 class NLUConfig:
+    __slots__ = ("nlu_type", "config", "local_test")
+
     def __init__(self, nlu_type: str, config: Dict[str, Any], local_test: bool):
         self.nlu_type = nlu_type
         self.config = config
@@ -22,6 +27,8 @@ class NLUConfig:
 
 # Assistant configuration
 class AssistantConfig:
+    __slots__ = ("name", "intents", "slots", "policies", "nlu")
+
     def __init__(
         self,
         name: str,
@@ -37,15 +44,39 @@ class AssistantConfig:
         self.nlu = nlu
 
 
+# Parsed configurations by file path, along with the file mtime they were parsed at
+_CONFIG_CACHE: Dict[str, Tuple[int, AssistantConfig]] = {}
+
+
 # Configuration loader class
 class AssistantConfigLoader:
     def __init__(self, yaml_file: str):
         self.yaml_file = yaml_file
 
     def load(self) -> AssistantConfig:
+        """Load the assistant configuration, reusing the last parse if the file is unchanged."""
+        cache_key = os.path.abspath(self.yaml_file)
+        mtime_ns = os.stat(cache_key).st_mtime_ns
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        assistant_config = self._parse()
+        _CONFIG_CACHE[cache_key] = (mtime_ns, assistant_config)
+        return assistant_config
+
+    def _parse(self) -> AssistantConfig:
+        # yaml is only needed here, don't pay its import cost when importing tomo.config
+        import yaml  # pylint: disable=C0415
+
+        try:
+            from yaml import CSafeLoader as YamlLoader  # pylint: disable=C0415
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as YamlLoader  # pylint: disable=C0415
+
         # Load YAML data
         with open(self.yaml_file, "r") as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=YamlLoader)
 
         # Parse assistant configuration
         assistant_data = data["assistant"]
@@ -57,6 +88,10 @@ class AssistantConfigLoader:
         # Parse slots
         slots = [Slot(**slot) for slot in assistant_data.get("slots", [])]
 
+        # Names are compared on every message, interned strings compare by identity
+        for item in intents + slots:
+            item.name = sys.intern(item.name)
+
         # Parse policies
         policies = [
             PolicyConfig(**policy_data)
@@ -1,3 +1,30 @@
+import importlib
+
+from tomo.shared.action import Action
+
 from .builtin import *
-from .flight_exchange import *
-from .weather import FindWeather
+
+# Slot values set by the lazily imported actions must deserialize before they're loaded
+from . import _schemas  # pylint: disable=W0611
+
+# Domain specific actions are imported on first access instead of with the package.
+_LAZY_MODULES = (".flight_exchange", ".weather")
+
+
+def load_actions() -> None:
+    """Import every domain action module so that their actions are registered."""
+    for module_name in _LAZY_MODULES:
+        importlib.import_module(module_name, __name__)
+
+
+def __getattr__(name):
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(module_name, __name__)
+        if hasattr(module, name):
+            value = getattr(module, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+Action.lazy_loaders.append(load_actions)
@@ -0,0 +1,23 @@
+import typing
+from dataclasses import dataclass
+
+from tomo.utils.json import json_serializable
+
+
+@json_serializable
+@dataclass(frozen=True, slots=True)
+class PnrDetails:
+    """Passenger Name Record retrieved from the reservation system."""
+
+    pnr_number: str
+    status: typing.Optional[str] = None
+
+
+@json_serializable
+@dataclass(frozen=True, slots=True)
+class PricingInformation:
+    """Price of an exchange, as computed by the reservation system."""
+
+    additional_fee: float
+    refund: float
+    pqr_number: str
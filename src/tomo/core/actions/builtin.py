@@ -24,8 +24,8 @@ class ActionListen(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        pass
+    ) -> typing.List[Event]:
+        return []
 
 
 class ActionReinitializeSlot(Action):
@@ -40,11 +40,12 @@ class ActionReinitializeSlot(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = time.time()
         return [
             SlotUnset(
                 key=slot,
-                timestamp=time.time(),
+                timestamp=now,
                 metadata=None,
             )
             for slot in self.slots
@@ -63,7 +64,7 @@ class ActionBotUtter(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
         await output_channel.send_text_message(self.message)
         return [
             BotUttered(
@@ -83,10 +84,10 @@ class ActionBotUtterQuickReply(ActionBotUtter):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
         if not session.has_bot_replied():
             await output_channel.send_text_message(self.message)
-            logger.debug(f"Quick {self.message} reply has been sent.")
+            logger.debug("Quick %s reply has been sent.", self.message)
             return [
                 BotUttered(
                     text=self.message,
@@ -106,7 +107,7 @@ class ActionExtractSlots(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
         user_uttered: UserUttered = session.last_user_uttered_event()
 
         if user_uttered is None or not isinstance(user_uttered, UserUttered):
@@ -116,24 +117,29 @@ class ActionExtractSlots(Action):
         new_entities: typing.List[Entity] = (
             user_uttered and user_uttered.entities
         ) or []
+        now = time.time()
+        # Checked once instead of for each entity
+        debug = logger.isEnabledFor(logging.DEBUG)
         for entity in new_entities:
             if entity.name not in session.slots:
                 logger.warning(
-                    f"Extracted entity {entity.name} are not in session's defined slots"
+                    "Extracted entity %s are not in session's defined slots",
+                    entity.name,
                 )
                 continue
             if entity.replace is None or entity.replace:
-                logger.debug(f"Generating SlotSet event of {entity.name}")
+                if debug:
+                    logger.debug("Generating SlotSet event of %s", entity.name)
                 events.append(
                     SlotSet(
                         key=entity.name,
                         value=entity.value,
-                        timestamp=time.time(),
+                        timestamp=now,
                         metadata=None,
                     )
                 )
-            else:
-                logger.debug(f"{entity} won't be setted.")
+            elif debug:
+                logger.debug("%s won't be setted.", entity)
         return events
 
 
@@ -149,7 +155,7 @@ class ActionSessionStart(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
         await output_channel.send_text_message(self.greeting_message)
         return [
             BotUttered(
@@ -181,8 +187,8 @@ class ActionUpdateStep(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        logger.debug(f"Updating step to: {self.step_name}")
+    ) -> typing.List[Event]:
+        logger.debug("Updating step to: %s", self.step_name)
         return [
             SlotSet(
                 key="step",
@@ -1,10 +1,12 @@
 # pylint: disable=C0301
 # Line too long
 
+import asyncio
 import logging
 import time
 import typing
 
+from tomo.core.actions._schemas import PnrDetails, PricingInformation
 from tomo.core.events import (
     SlotSet,
     BotUttered,
@@ -18,6 +20,150 @@ from tomo.shared.exceptions import TomoFatalException
 
 logger = logging.getLogger(__name__)
 
+# Wall clock used for event timestamps, bound once instead of looked up in each run
+_now = time.time
+
+# Messages sent to the user
+LATENCY_MESSAGE = "Just a moment, I'm looking that up."
+ASK_CLIENT_LOCATION = "Could you please provide your location?"
+SERVICE_UNAVAILABLE = "Sorry, our service is not available in your location."
+ASK_PNR_DETAILS = "Cannot cancel itinerary without PNR details."
+CANCELLATION_FAILED = "Failed to cancel your existing itinerary."
+ASK_NEW_ITINERARY = "Please provide the details of your new itinerary."
+BOOKING_FAILED = "Unable to book your new itinerary."
+ASK_ORIGINAL_TICKET_NUMBER = "I need your original ticket number to price the exchange."
+PRICING_FAILED = "Unable to obtain pricing information at this time."
+ASK_PRICING_INFORMATION = "There is no pricing information to evaluate."
+ASK_PQR_NUMBER = "Cannot confirm exchange without a PQR number."
+CONFIRMATION_FAILED = "Failed to confirm your exchange."
+ASK_PNR_NUMBER = "Cannot retrieve updated PNR without PNR number."
+UPDATED_PNR_FAILED = "Failed to retrieve your updated booking details."
+ASK_REISSUE_NUMBER = "Cannot issue ticket without a reissue number."
+TICKETING_FAILED = "Failed to issue your ticket."
+PRICING_PROPOSAL = (
+    "The exchange will cost an additional ${additional_fee:.2f}. "
+    "Would you like to proceed?"
+)
+EXCHANGE_COMPLETED = (
+    "Your ticket exchange is complete. A confirmation email has been sent to you."
+)
+PENDING_HUMAN_APPROVAL = "Your exchange request is pending approval from a human agent."
+
+# Seconds a backend call can take before the user is told to wait
+LATENCY_MESSAGE_DELAY = 1.0
+
+PNR_CACHE_TTL = 600  # in seconds
+PNR_CACHE_NEGATIVE_TTL = 30  # in seconds, for PNRs which couldn't be retrieved
+PNR_CACHE_MAX_SIZE = 1024
+
+# Retrieved PNR details by PNR number, along with their expiry time. The actions
+# changing a PNR drop its details.
+_PNR_CACHE: typing.Dict[str, typing.Tuple[float, typing.Optional[PnrDetails]]] = {}
+
+
+def _uttered(text: str, now: float) -> BotUttered:
+    return BotUttered(text=text, data=None, timestamp=now, metadata=None)
+
+
+async def _run_with_latency_message(
+    output_channel: OutputChannel, call: typing.Awaitable, now: float
+) -> typing.Tuple[typing.Any, typing.List[Event]]:
+    """Await a backend call, telling the user to wait if it takes a while.
+
+    Returns the result of the call and the event of the latency message, if the call
+    ran past `LATENCY_MESSAGE_DELAY` and the message was sent.
+    """
+    task = asyncio.ensure_future(call)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=LATENCY_MESSAGE_DELAY)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if done:
+        return task.result(), []
+
+    await output_channel.send_text_message(LATENCY_MESSAGE)
+    return await task, [_uttered(LATENCY_MESSAGE, now)]
+
+
+async def _cached_pnr_fetch(
+    pnr_number: str,
+    fetcher: typing.Callable[[str], typing.Awaitable[typing.Optional[PnrDetails]]],
+    ttl: float = PNR_CACHE_TTL,
+    refresh: bool = False,
+) -> typing.Optional[PnrDetails]:
+    """Fetch the PNR details, reusing the ones retrieved less than `ttl` seconds ago.
+
+    With `refresh`, the PNR is always fetched and the cached details are replaced.
+    """
+    if not refresh and _is_pnr_cached(pnr_number):
+        return _PNR_CACHE[pnr_number][1]
+
+    pnr_details = await fetcher(pnr_number)
+    if len(_PNR_CACHE) >= PNR_CACHE_MAX_SIZE:
+        _PNR_CACHE.pop(next(iter(_PNR_CACHE)))
+    # Failed retrievals are only kept shortly, the PNR may be readable in a moment
+    _PNR_CACHE[pnr_number] = (
+        time.monotonic() + (ttl if pnr_details else PNR_CACHE_NEGATIVE_TTL),
+        pnr_details,
+    )
+    return pnr_details
+
+
+def _is_pnr_cached(pnr_number: str) -> bool:
+    cached = _PNR_CACHE.get(pnr_number)
+    return cached is not None and cached[0] > time.monotonic()
+
+
+def _forget_pnr(session: Session) -> None:
+    """Drop the cached details of the session's PNR, once an action changed it."""
+    pnr_number = session.slots.get("pnr_number")
+    if pnr_number and pnr_number.value:
+        _PNR_CACHE.pop(pnr_number.value, None)
+    pnr_details = session.slots.get("pnr_details")
+    if pnr_details and pnr_details.value:
+        _PNR_CACHE.pop(pnr_details.value.pnr_number, None)
+
+
+async def _check_service_availability(client_location) -> bool:
+    # Placeholder for actual service availability check
+    return True  # Assume service is available
+
+
+async def _book_itinerary(new_itinerary_details) -> bool:
+    # Placeholder for actual booking
+    return True  # Assume success
+
+
+async def _price_exchange(
+    original_ticket_number, new_itinerary_details
+) -> typing.Optional[PricingInformation]:
+    # Placeholder for actual pricing
+    return PricingInformation(
+        additional_fee=150.00, refund=0.00, pqr_number="PQR123456"
+    )
+
+
+async def _read_pnr(pnr_number: str) -> typing.Optional[PnrDetails]:
+    # Placeholder for actual PNR retrieval
+    return PnrDetails(pnr_number=pnr_number)  # Mocked PNR details
+
+
+async def _end_transaction_and_read_pnr(
+    pnr_number: str,
+) -> typing.Optional[PnrDetails]:
+    # Placeholder for ending transaction and retrieving updated PNR
+    return PnrDetails(pnr_number=pnr_number, status="updated")
+
+
+async def _ask_for_slot(
+    output_channel: OutputChannel, slot_name: str, prompt: str, now: float
+) -> typing.List[Event]:
+    """Ask the user to provide a slot the action can't run without."""
+    logger.debug("Slot %s not provided.", slot_name)
+    await output_channel.send_text_message(prompt)
+    return [_uttered(prompt, now)]
+
 
 class ValidateServiceAvailability(Action):
     name: typing.ClassVar[str] = "validate_service_availability"
@@ -25,46 +171,31 @@ class ValidateServiceAvailability(Action):
         str
     ] = "Validate if the service is available in the client's market."
 
-    @classmethod
-    def required_slots(cls):
-        return ["client_location"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("client_location",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         client_location = session.slots.get("client_location")
         if not client_location:
-            logger.debug("Client location not provided.")
-            await output_channel.send_text_message(
-                "Could you please provide your location?"
+            return await _ask_for_slot(
+                output_channel,
+                "client_location",
+                ASK_CLIENT_LOCATION,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Could you please provide your location?",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
-        # Placeholder for actual service availability check
-        service_available = True  # Assume service is available
+        service_available = await _check_service_availability(client_location)
 
         if service_available:
-            logger.debug(f"Service is available in {client_location}.")
+            logger.debug("Service is available in %s.", client_location)
             return []
 
-        logger.debug(f"Service is not available in {client_location}.")
-        await output_channel.send_text_message(
-            "Sorry, our service is not available in your location."
-        )
+        logger.debug("Service is not available in %s.", client_location)
+        await output_channel.send_text_message(SERVICE_UNAVAILABLE)
         return [
-            BotUttered(
-                text="Sorry, our service is not available in your location.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            ),
+            _uttered(SERVICE_UNAVAILABLE, now),
             SessionDisabled(),
         ]
 
@@ -75,46 +206,34 @@ class ActionExchangeShopping(Action):
         str
     ] = "Validate if the service is available in the client's market."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pnr_details", "new_itinerary"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = (
+        "pnr_details",
+        "new_itinerary",
+    )
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         client_location = session.slots.get("client_location")
         if not client_location:
-            logger.debug("Client location not provided.")
-            await output_channel.send_text_message(
-                "Could you please provide your location?"
+            return await _ask_for_slot(
+                output_channel,
+                "client_location",
+                ASK_CLIENT_LOCATION,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Could you please provide your location?",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
-        # Placeholder for actual service availability check
-        service_available = True  # Assume service is available
+        service_available = await _check_service_availability(client_location)
 
         if service_available:
-            logger.debug(f"Service is available in {client_location}.")
+            logger.debug("Service is available in %s.", client_location)
             return []
 
-        logger.debug(f"Service is not available in {client_location}.")
-        await output_channel.send_text_message(
-            "Sorry, our service is not available in your location."
-        )
+        logger.debug("Service is not available in %s.", client_location)
+        await output_channel.send_text_message(SERVICE_UNAVAILABLE)
         return [
-            BotUttered(
-                text="Sorry, our service is not available in your location.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            ),
+            _uttered(SERVICE_UNAVAILABLE, now),
             SessionDisabled(),
         ]
 
@@ -125,34 +244,39 @@ class RetrievePNR(Action):
         str
     ] = "Retrieve the Passenger Name Record (PNR) details using TravelItineraryReadLLSRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pnr_number"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("pnr_number",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         slot = session.slots.get("pnr_number")
         if not slot:
             raise TomoFatalException("pnr_number is missing")
 
         pnr_number = slot.value
-        # Placeholder for actual PNR retrieval
-        logger.debug(f"Retrieving PNR details for {pnr_number}.")
-        pnr_details = {"pnr_number": pnr_number}  # Mocked PNR details
+        logger.debug("Retrieving PNR details for %s.", pnr_number)
+        if _is_pnr_cached(pnr_number):
+            pnr_details = await _cached_pnr_fetch(pnr_number, _read_pnr)
+            events = []
+        else:
+            pnr_details, events = await _run_with_latency_message(
+                output_channel, _cached_pnr_fetch(pnr_number, _read_pnr), now
+            )
 
         if not pnr_details:
             raise TomoFatalException(f"Cannot retrieve the PNR for {pnr_number}")
 
-        logger.debug(f"PNR details retrieved for {pnr_number}.")
-        return [
+        logger.debug("PNR details retrieved for %s.", pnr_number)
+        events.append(
             SlotSet(
                 key="pnr_details",
                 value=pnr_details,
-                timestamp=time.time(),
+                timestamp=now,
                 metadata=None,
             )
-        ]
+        )
+        return events
 
 
 class CancelExistingItinerary(Action):
@@ -161,48 +285,33 @@ class CancelExistingItinerary(Action):
         str
     ] = "Cancel the existing itinerary in the PNR using OTA_CancelLLSRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pnr_details"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("pnr_details",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         pnr_details = session.slots.get("pnr_details")
         if not pnr_details:
-            logger.debug("PNR details not available.")
-            await output_channel.send_text_message(
-                "Cannot cancel itinerary without PNR details."
+            return await _ask_for_slot(
+                output_channel,
+                "pnr_details",
+                ASK_PNR_DETAILS,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Cannot cancel itinerary without PNR details.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
         # Placeholder for actual cancellation
-        logger.debug(f"Cancelling itinerary for PNR {pnr_details['pnr_number']}.")
+        logger.debug("Cancelling itinerary for PNR %s.", pnr_details.value.pnr_number)
         cancellation_success = True  # Assume success
+        _forget_pnr(session)
 
         if cancellation_success:
             logger.debug("Itinerary cancelled successfully.")
             return []
 
         logger.debug("Failed to cancel itinerary.")
-        await output_channel.send_text_message(
-            "Failed to cancel your existing itinerary."
-        )
-        return [
-            BotUttered(
-                text="Failed to cancel your existing itinerary.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(CANCELLATION_FAILED)
+        return [_uttered(CANCELLATION_FAILED, now)]
 
 
 class BookNewItinerary(Action):
@@ -211,46 +320,35 @@ class BookNewItinerary(Action):
         str
     ] = "Book the new air itinerary as requested by the client using OTA_AirBookLLSRQ or EnhancedAirBookRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["new_itinerary_details"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("new_itinerary_details",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         new_itinerary_details = session.slots.get("new_itinerary_details")
         if not new_itinerary_details:
-            logger.debug("New itinerary details not provided.")
-            await output_channel.send_text_message(
-                "Please provide the details of your new itinerary."
+            return await _ask_for_slot(
+                output_channel,
+                "new_itinerary_details",
+                ASK_NEW_ITINERARY,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Please provide the details of your new itinerary.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
-        # Placeholder for actual booking
-        logger.debug(f"Booking new itinerary: {new_itinerary_details}")
-        booking_success = True  # Assume success
+        logger.debug("Booking new itinerary: %s", new_itinerary_details)
+        booking_success, events = await _run_with_latency_message(
+            output_channel, _book_itinerary(new_itinerary_details), now
+        )
+        _forget_pnr(session)
 
         if booking_success:
             logger.debug("New itinerary booked successfully.")
-            return []
+            return events
 
         logger.debug("Failed to book new itinerary.")
-        await output_channel.send_text_message("Unable to book your new itinerary.")
-        return [
-            BotUttered(
-                text="Unable to book your new itinerary.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(BOOKING_FAILED)
+        events.append(_uttered(BOOKING_FAILED, now))
+        return events
 
 
 class PriceTheExchange(Action):
@@ -259,66 +357,57 @@ class PriceTheExchange(Action):
         str
     ] = "Price the exchange based on the new itinerary and calculate any additional fees or refunds using AutomatedExchangesLLSRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["original_ticket_number", "new_itinerary_details"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = (
+        "original_ticket_number",
+        "new_itinerary_details",
+    )
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        original_ticket_number = session.slots.get("original_ticket_number")
-        new_itinerary_details = session.slots.get("new_itinerary_details")
+    ) -> typing.List[Event]:
+        now = _now()
+        slots = session.slots
+        original_ticket_number = slots.get("original_ticket_number")
+        new_itinerary_details = slots.get("new_itinerary_details")
         if not original_ticket_number or not new_itinerary_details:
-            logger.debug("Missing information for pricing the exchange.")
-            await output_channel.send_text_message(
-                "I need your original ticket number to price the exchange."
+            return await _ask_for_slot(
+                output_channel,
+                "original_ticket_number"
+                if not original_ticket_number
+                else "new_itinerary_details",
+                ASK_ORIGINAL_TICKET_NUMBER,
+                now,
             )
-            return [
-                BotUttered(
-                    text="I need your original ticket number to price the exchange.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
-        # Placeholder for actual pricing
-        logger.debug(f"Pricing exchange for ticket {original_ticket_number}")
-        pricing_information = {
-            "additional_fee": 150.00,
-            "refund": 0.00,
-            "pqr_number": "PQR123456",
-        }
+        logger.debug("Pricing exchange for ticket %s", original_ticket_number)
+        pricing_information, events = await _run_with_latency_message(
+            output_channel,
+            _price_exchange(original_ticket_number, new_itinerary_details),
+            now,
+        )
 
         if pricing_information:
             logger.debug("Pricing information obtained.")
             return [
+                *events,
                 SlotSet(
                     key="pricing_information",
                     value=pricing_information,
-                    timestamp=time.time(),
+                    timestamp=now,
                     metadata=None,
                 ),
                 SlotSet(
                     key="pqr_number",
-                    value=pricing_information["pqr_number"],
-                    timestamp=time.time(),
+                    value=pricing_information.pqr_number,
+                    timestamp=now,
                     metadata=None,
                 ),
             ]
 
         logger.debug("Failed to obtain pricing information.")
-        await output_channel.send_text_message(
-            "Unable to obtain pricing information at this time."
-        )
-        return [
-            BotUttered(
-                text="Unable to obtain pricing information at this time.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(PRICING_FAILED)
+        events.append(_uttered(PRICING_FAILED, now))
+        return events
 
 
 class EvaluatePricingInformation(Action):
@@ -327,47 +416,32 @@ class EvaluatePricingInformation(Action):
         str
     ] = "Evaluate the returned pricing information and decide whether to proceed or ignore the transaction."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pricing_information"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("pricing_information",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         pricing_information = session.slots.get("pricing_information")
         if not pricing_information:
-            logger.debug("No pricing information to evaluate.")
-            await output_channel.send_text_message(
-                "There is no pricing information to evaluate."
+            return await _ask_for_slot(
+                output_channel,
+                "pricing_information",
+                ASK_PRICING_INFORMATION,
+                now,
             )
-            return [
-                BotUttered(
-                    text="There is no pricing information to evaluate.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
         # Present pricing to the user
-        additional_fee = pricing_information.get("additional_fee")
-        message = (
-            f"The exchange will cost an additional ${additional_fee:.2f}. "
-            "Would you like to proceed?"
-        )
+        additional_fee = pricing_information.value.additional_fee
+        message = PRICING_PROPOSAL.format(additional_fee=additional_fee)
         await output_channel.send_text_message(message)
         return [
-            BotUttered(
-                text=message,
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            ),
+            _uttered(message, now),
             # Wait for user confirmation
             SlotSet(
                 key="awaiting_user_confirmation",
                 value=True,
-                timestamp=time.time(),
+                timestamp=now,
                 metadata=None,
             ),
         ]
@@ -379,46 +453,33 @@ class ConfirmExchange(Action):
         str
     ] = "Confirm and store the exchange using ExchangeConfirmation in AutomatedExchangesLLSRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pqr_number"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("pqr_number",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         pqr_number = session.slots.get("pqr_number")
         if not pqr_number:
-            logger.debug("PQR number not available.")
-            await output_channel.send_text_message(
-                "Cannot confirm exchange without a PQR number."
+            return await _ask_for_slot(
+                output_channel,
+                "pqr_number",
+                ASK_PQR_NUMBER,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Cannot confirm exchange without a PQR number.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
         # Placeholder for actual confirmation
-        logger.debug(f"Confirming exchange with PQR number {pqr_number}.")
+        logger.debug("Confirming exchange with PQR number %s.", pqr_number)
         confirmation_success = True  # Assume success
+        _forget_pnr(session)
 
         if confirmation_success:
             logger.debug("Exchange confirmed successfully.")
             return []
 
         logger.debug("Failed to confirm exchange.")
-        await output_channel.send_text_message("Failed to confirm your exchange.")
-        return [
-            BotUttered(
-                text="Failed to confirm your exchange.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(CONFIRMATION_FAILED)
+        return [_uttered(CONFIRMATION_FAILED, now)]
 
 
 class EndAndRetrieveUpdatedPNR(Action):
@@ -427,31 +488,29 @@ class EndAndRetrieveUpdatedPNR(Action):
         str
     ] = "Commit the changes to the PNR after the exchange details are confirmed and retrieve the updated PNR."
 
-    @classmethod
-    def required_slots(cls):
-        return ["pnr_number"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("pnr_number",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        pnr_number = session.slots.get("pnr_number")
-        if not pnr_number:
-            logger.debug("PNR number not available.")
-            await output_channel.send_text_message(
-                "Cannot retrieve updated PNR without PNR number."
+    ) -> typing.List[Event]:
+        now = _now()
+        slot = session.slots.get("pnr_number")
+        if not slot:
+            return await _ask_for_slot(
+                output_channel,
+                "pnr_number",
+                ASK_PNR_NUMBER,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Cannot retrieve updated PNR without PNR number.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
-        # Placeholder for ending transaction and retrieving updated PNR
-        logger.debug(f"Ending transaction and retrieving updated PNR for {pnr_number}.")
-        updated_pnr_details = {"pnr_number": pnr_number, "status": "updated"}
+        pnr_number = slot.value
+        logger.debug(
+            "Ending transaction and retrieving updated PNR for %s.", pnr_number
+        )
+        # The PNR changes when the transaction ends, replace its cached details
+        updated_pnr_details = await _cached_pnr_fetch(
+            pnr_number, _end_transaction_and_read_pnr, refresh=True
+        )
 
         if updated_pnr_details:
             logger.debug("Updated PNR retrieved successfully.")
@@ -459,23 +518,14 @@ class EndAndRetrieveUpdatedPNR(Action):
                 SlotSet(
                     key="pnr_details",
                     value=updated_pnr_details,
-                    timestamp=time.time(),
+                    timestamp=now,
                     metadata=None,
                 )
             ]
 
         logger.debug("Failed to retrieve updated PNR.")
-        await output_channel.send_text_message(
-            "Failed to retrieve your updated booking details."
-        )
-        return [
-            BotUttered(
-                text="Failed to retrieve your updated booking details.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(UPDATED_PNR_FAILED)
+        return [_uttered(UPDATED_PNR_FAILED, now)]
 
 
 class TicketTheExchange(Action):
@@ -484,46 +534,33 @@ class TicketTheExchange(Action):
         str
     ] = "Issue the exchanged ticket based on the updated PNR information using AirTicketLLSRQ."
 
-    @classmethod
-    def required_slots(cls):
-        return ["reissue_number"]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("reissue_number",)
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         reissue_number = session.slots.get("reissue_number")
         if not reissue_number:
-            logger.debug("Reissue number not available.")
-            await output_channel.send_text_message(
-                "Cannot issue ticket without a reissue number."
+            return await _ask_for_slot(
+                output_channel,
+                "reissue_number",
+                ASK_REISSUE_NUMBER,
+                now,
             )
-            return [
-                BotUttered(
-                    text="Cannot issue ticket without a reissue number.",
-                    data=None,
-                    timestamp=time.time(),
-                    metadata=None,
-                )
-            ]
 
         # Placeholder for actual ticketing
-        logger.debug(f"Issuing ticket with reissue number {reissue_number}.")
+        logger.debug("Issuing ticket with reissue number %s.", reissue_number)
         ticketing_success = True  # Assume success
+        _forget_pnr(session)
 
         if ticketing_success:
             logger.debug("Ticket issued successfully.")
             return []
 
         logger.debug("Failed to issue ticket.")
-        await output_channel.send_text_message("Failed to issue your ticket.")
-        return [
-            BotUttered(
-                text="Failed to issue your ticket.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(TICKETING_FAILED)
+        return [_uttered(TICKETING_FAILED, now)]
 
 
 class CompletionConfirmation(Action):
@@ -534,17 +571,10 @@ class CompletionConfirmation(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        message = "Your ticket exchange is complete. A confirmation email has been sent to you."
-        await output_channel.send_text_message(message)
-        return [
-            BotUttered(
-                text=message,
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+    ) -> typing.List[Event]:
+        now = _now()
+        await output_channel.send_text_message(EXCHANGE_COMPLETED)
+        return [_uttered(EXCHANGE_COMPLETED, now)]
 
 
 class AskHumanConfirmation(Action):
@@ -555,17 +585,9 @@ class AskHumanConfirmation(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
+        now = _now()
         logger.debug("Requesting human agent approval.")
         # Placeholder for notifying human agent
-        await output_channel.send_text_message(
-            "Your exchange request is pending approval from a human agent."
-        )
-        return [
-            BotUttered(
-                text="Your exchange request is pending approval from a human agent.",
-                data=None,
-                timestamp=time.time(),
-                metadata=None,
-            )
-        ]
+        await output_channel.send_text_message(PENDING_HUMAN_APPROVAL)
+        return [_uttered(PENDING_HUMAN_APPROVAL, now)]
@@ -18,19 +18,15 @@ class FindWeather(Action):
         str
     ] = "Find the weather information according to the location and date"
 
-    @classmethod
-    def required_slots(cls):
-        return [
-            "date",
-            "city",
-        ]
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ("date", "city")
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        date = session.slots.get("date")
-        city = session.slots.get("city")
-        logger.debug(f"Getting the weather information for {city} at {date}")
+    ) -> typing.List[Event]:
+        slots = session.slots
+        date = slots.get("date")
+        city = slots.get("city")
+        logger.debug("Getting the weather information for %s at %s", city, date)
         return [
             SlotSet(
                 key="weather",
@@ -1,44 +1,83 @@
+import asyncio
+from collections import OrderedDict
 from datetime import datetime
+import importlib
 import logging
 import os
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 
 from langchain.prompts import (
     ChatPromptTemplate,
     SystemMessagePromptTemplate,
     HumanMessagePromptTemplate,
 )
-from langchain.chat_models import ChatOpenAI, AzureChatOpenAI
-from langchain.llms import LlamaCpp, HuggingFaceHub
 
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_TTL = 300  # in seconds
+
+# LLM classes by llm_type, their modules are only imported when the type is used
+LLM_CLASSES = {
+    "openai": ("langchain.chat_models", "ChatOpenAI"),
+    "azure_openai": ("langchain.chat_models", "AzureChatOpenAI"),
+    "llamacpp": ("langchain.llms", "LlamaCpp"),
+    "huggingfacehub": ("langchain.llms", "HuggingFaceHub"),
+}
+
+
+def _write_file(filename: str, content: str):
+    with open(filename, "w") as fh:
+        fh.write(content)
+
 
 class BaseLLMComponent:
     """Base class for LLM-based components with common initialization and utilities"""
 
-    llm_map = {
-        "openai": ChatOpenAI,
-        "azure_openai": AzureChatOpenAI,
-        "llamacpp": LlamaCpp,
-        "huggingfacehub": HuggingFaceHub,
-    }
-
     def __init__(self, llm_config: Optional[Dict[str, Any]] = None):
         self.llm_config = llm_config or {}
         self.llm = self._initialize_llm()
         self.prompt = None
 
+        # LLM results by prompt inputs, disabled unless cache_size is configured.
+        # The inputs render the whole session state, so a hit means the same prompt.
+        self.cache_size = self.llm_config.get("cache_size", 0)
+        self.cache_ttl = self.llm_config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        self._cache: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+
     def _initialize_llm(self):
         """Initialize the appropriate LLM based on configuration"""
         llm_type = self.llm_config.get("llm_type", "openai")
         llm_params = self.llm_config.get("llm_params", {})
 
-        if llm_type not in self.llm_map:
+        if llm_type not in LLM_CLASSES:
             raise ValueError(f"LLM type '{llm_type}' is not supported.")
 
-        return self.llm_map[llm_type](**llm_params)
+        module_name, class_name = LLM_CLASSES[llm_type]
+        llm_cls = getattr(importlib.import_module(module_name), class_name)
+        return llm_cls(**llm_params)
+
+    async def _ainvoke(self, inputs: Dict[str, Any]) -> Any:
+        """Invoke the LLM chain, reusing a recent result for identical inputs"""
+        if self.cache_size <= 0:
+            return await self._ainvoke_llm(inputs)
+
+        key = tuple(sorted(inputs.items()))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._cache.move_to_end(key)
+            return cached[1]
+
+        result = await self._ainvoke_llm(inputs)
+        self._cache[key] = (time.monotonic() + self.cache_ttl, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    async def _ainvoke_llm(self, inputs: Dict[str, Any]) -> Any:
+        return await self.llm_chain.ainvoke(inputs)
 
     def _setup_chain(self, system_prompt: str, human_prompt: str, output_parser):
         """Set up the LLM processing chain"""
@@ -50,14 +89,17 @@ class BaseLLMComponent:
         )
         return self.prompt | self.llm | output_parser
 
-    def _save_prompts(self, session_id: str, prompts: List[str], prefix: str):
-        """Save prompts to files for debugging"""
+    async def _save_prompts(self, session_id: str, prompts: List[str], prefix: str):
+        """Save prompts to files for debugging, without blocking the event loop"""
         directory_path = os.path.join("session_logs", str(session_id))
-        os.makedirs(directory_path, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, directory_path, exist_ok=True)
 
         timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S.%f")
+        writes = []
         for idx, content in enumerate(prompts):
             prompt_type = "system" if idx == 0 else "user"
-            filename = f"session_logs/{session_id}/{timestamp}-{prefix}_{prompt_type}_prompt.txt"
-            with open(filename, "w") as fh:
-                fh.write(content)
+            filename = os.path.join(
+                directory_path, f"{timestamp}-{prefix}_{prompt_type}_prompt.txt"
+            )
+            writes.append(asyncio.to_thread(_write_file, filename, content))
+        await asyncio.gather(*writes)
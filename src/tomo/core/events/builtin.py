@@ -1,14 +1,19 @@
 import logging
+import sys
 import typing
+from dataclasses import dataclass
 
 from tomo.nlu.models import Entity, IntentExtraction
 from tomo.shared.event import Event
 from tomo.shared.session import Session
+from tomo.utils.json import json_serializable
 
 
 logger = logging.getLogger(__name__)
 
 
+@json_serializable
+@dataclass(slots=True)
 class SessionShutdown(Event):
     """
     Event indicating that the session has been shutdown.
@@ -23,6 +28,8 @@ class SessionShutdown(Event):
         session.deactivate()
 
 
+@json_serializable
+@dataclass(slots=True)
 class UserUttered(Event):
     """
     Event representing the user sending a message to the bot.
@@ -58,6 +65,8 @@ class UserUttered(Event):
         return self.intent and self.intent.name
 
 
+@json_serializable
+@dataclass(slots=True)
 class BotUttered(Event):
     """
     Event representing the bot sending a message to the user.
@@ -73,6 +82,7 @@ class BotUttered(Event):
     """
 
     name: typing.ClassVar[str] = "Bot talked"
+    _is_noop: typing.ClassVar[bool] = True
 
     text: typing.Optional[str] = None
     data: typing.Optional[typing.Dict] = None
@@ -87,6 +97,8 @@ class BotUttered(Event):
         return
 
 
+@json_serializable
+@dataclass(slots=True)
 class SlotSet(Event):
     """
     Event representing a slot being set by the user or bot.
@@ -102,6 +114,10 @@ class SlotSet(Event):
     key: str
     value: typing.Optional[typing.Any] = None
 
+    def __post_init__(self):
+        # Slot and action names come from a small vocabulary, share them between events
+        self.key = sys.intern(self.key)
+
     def apply_to(self, session: "Session") -> None:
         """
         Update the session by setting the specified slot value.
@@ -116,6 +132,8 @@ class SlotSet(Event):
         return f"Set slot {self.key} value"
 
 
+@json_serializable
+@dataclass(slots=True)
 class SlotUnset(Event):
     """
     Event representing a slot being unset by the user or bot.
@@ -129,6 +147,9 @@ class SlotUnset(Event):
 
     key: str
 
+    def __post_init__(self):
+        self.key = sys.intern(self.key)
+
     def apply_to(self, session: "Session") -> None:
         """
         Update the session by setting the specified slot value.
@@ -143,6 +164,8 @@ class SlotUnset(Event):
         return f"Unset slot {self.key} value"
 
 
+@json_serializable
+@dataclass(slots=True)
 class ActionExecuted(Event):
     """
     Event representing an action executed by the bot.
@@ -157,6 +180,9 @@ class ActionExecuted(Event):
     action_name: str
     policy: typing.Optional[str] = None
 
+    def __post_init__(self):
+        self.action_name = sys.intern(self.action_name)
+
     def apply_to(self, session: "Session") -> None:
         """
         Update the session to reflect the action taken by the bot.
@@ -171,10 +197,17 @@ class ActionExecuted(Event):
         return f"Action {self.action_name} executed"
 
 
+@json_serializable
+@dataclass(slots=True)
 class ActionFailed(Event):
+    _is_noop: typing.ClassVar[bool] = True
+
     action_name: str
     policy: typing.Optional[str] = None
 
+    def __post_init__(self):
+        self.action_name = sys.intern(self.action_name)
+
     def apply_to(self, session: "Session") -> None:
         # TODO: thinking about how to handle the failed action
         pass
@@ -184,6 +217,8 @@ class ActionFailed(Event):
         return f"Action {self.action_name} failed"
 
 
+@json_serializable
+@dataclass(slots=True)
 class SessionStarted(Event):
     """
     Event representing the start of a new session.
@@ -203,6 +238,8 @@ class SessionStarted(Event):
         session.reset()
 
 
+@json_serializable
+@dataclass(slots=True)
 class SessionDisabled(Event):
     """
     Event to disable a session.
@@ -1,8 +1,12 @@
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from tomo.shared.bot_message import BotMessage
 from tomo.shared.output_channel import OutputChannel
 
+# Shared by the messages sent without additional properties
+_EMPTY_PROPS: Mapping[str, Any] = MappingProxyType({})
+
 
 class CollectingOutputChannel(OutputChannel):
     """An output channel that collects messages in a list."""
@@ -26,11 +30,11 @@ class CollectingOutputChannel(OutputChannel):
         custom: Optional[Dict[str, Any]] = None,
         quick_replies: Optional[List[Dict[str, Any]]] = None,
         elements: Optional[List[Dict[str, Any]]] = None,
-        additional_properties: Optional[Dict[str, Any]] = None,
+        additional_properties: Optional[Mapping[str, Any]] = None,
     ) -> BotMessage:
         """Create a BotMessage object to store."""
-        if additional_properties is None:
-            additional_properties = {}
+        # Don't keep a new empty dict alive in every stored message
+        additional_properties = additional_properties or _EMPTY_PROPS
         return BotMessage(
             recipient_id=recipient_id,
             text=text,
@@ -43,19 +47,32 @@ class CollectingOutputChannel(OutputChannel):
             additional_properties=additional_properties,
         )
 
-    async def _persist_message(self, message: BotMessage) -> None:
-        """Save the message to the message list."""
+    def _persist_message(self, message: BotMessage) -> None:
+        """Save the message to the message list.
+
+        Storing is a list append, it doesn't need to go through the event loop.
+        """
         self.messages.append(message)
 
     async def send_text_message(
         self, text: str, recipient_id: Optional[str] = None, **kwargs: Any
     ) -> None:
         """Send a text message and persist it."""
-        for message_part in text.strip().split("\n\n"):
+        text = text.strip()
+        if "\n\n" not in text:
+            # Most messages are a single paragraph, no need to split them
             message = self._create_message(
+                recipient_id, text=text, additional_properties=kwargs
+            )
+            self._persist_message(message)
+            return
+
+        self.messages.extend(
+            self._create_message(
                 recipient_id, text=message_part, additional_properties=kwargs
             )
-            await self._persist_message(message)
+            for message_part in text.split("\n\n")
+        )
 
     async def send_image_url(
         self, image: str, recipient_id: Optional[str] = None, **kwargs: Any
@@ -64,7 +81,7 @@ class CollectingOutputChannel(OutputChannel):
         message = self._create_message(
             recipient_id, image=image, additional_properties=kwargs
         )
-        await self._persist_message(message)
+        self._persist_message(message)
 
     async def send_attachment(
         self, attachment: str, recipient_id: Optional[str] = None, **kwargs: Any
@@ -73,7 +90,7 @@ class CollectingOutputChannel(OutputChannel):
         message = self._create_message(
             recipient_id, attachment=attachment, additional_properties=kwargs
         )
-        await self._persist_message(message)
+        self._persist_message(message)
 
     async def send_text_with_buttons(
         self,
@@ -86,7 +103,7 @@ class CollectingOutputChannel(OutputChannel):
         message = self._create_message(
             recipient_id, text=text, buttons=buttons, additional_properties=kwargs
         )
-        await self._persist_message(message)
+        self._persist_message(message)
 
     async def send_quick_replies(
         self,
@@ -102,7 +119,7 @@ class CollectingOutputChannel(OutputChannel):
             quick_replies=quick_replies,
             additional_properties=kwargs,
         )
-        await self._persist_message(message)
+        self._persist_message(message)
 
     async def send_elements(
         self,
@@ -114,7 +131,7 @@ class CollectingOutputChannel(OutputChannel):
         message = self._create_message(
             recipient_id, elements=elements, additional_properties=kwargs
         )
-        await self._persist_message(message)
+        self._persist_message(message)
 
     async def send_custom_json(
         self,
@@ -126,4 +143,4 @@ class CollectingOutputChannel(OutputChannel):
         message = self._create_message(
             recipient_id, custom=json_message, additional_properties=kwargs
         )
-        await self._persist_message(message)
+        self._persist_message(message)
@@ -47,6 +47,11 @@ class BaseLLMPolicy(BaseLLMComponent, Policy):
             [generate_action_instruction(action) for action in self.actions]
         )
 
+    @cached_property
+    def format_instructions(self):
+        # Only depends on the output schema, which is fixed
+        return self.output_parser.get_format_instructions()
+
     @cached_property
     def intent_instruction(self):
         if not self.intents:
@@ -59,13 +64,13 @@ class BaseLLMPolicy(BaseLLMComponent, Policy):
 
             if self.local_test:
                 final_prompt = self.prompt.format_messages(**inputs)
-                self._save_prompts(
+                await self._save_prompts(
                     session.session_id,
                     [msg.content for msg in final_prompt],
                     f"policy-{self.name}",
                 )
 
-            result = self.llm_chain.invoke(inputs)
+            result = await self._ainvoke(inputs)
             logger.debug(f"LLM result: {result}")
             actions = [
                 Action.create(action["name"], **(action["arguments"] or {}))
@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import logging
 import typing
 
@@ -34,8 +35,20 @@ class LocalPolicyManager(PolicyManager):
     async def run(
         self, session: Session
     ) -> typing.AsyncGenerator[PolicyPrediction, None]:
-        for policy in self.policies:
+        """Run all the policies concurrently, yield predictions as soon as they are ready."""
+
+        async def _run_policy(policy: Policy) -> typing.Optional[PolicyPrediction]:
             policy_prediction = await policy.run(session)
             logger.debug(f"policy {policy.name} returns {policy_prediction}")
-            if policy_prediction is not None:
-                yield policy_prediction
+            return policy_prediction
+
+        tasks = [asyncio.create_task(_run_policy(policy)) for policy in self.policies]
+        try:
+            for next_prediction in asyncio.as_completed(tasks):
+                policy_prediction = await next_prediction
+                if policy_prediction is not None:
+                    yield policy_prediction
+        finally:
+            # the consumer may stop iterating early, don't leave policies running
+            for task in tasks:
+                task.cancel()
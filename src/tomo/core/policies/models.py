@@ -1,7 +1,9 @@
 import typing
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
+from tomo.core.actions import ActionDisableSession, ActionListen
 from tomo.shared.action import Action
 from tomo.utils.json import JSONSerializableBase, json_serializable
 
@@ -14,6 +16,14 @@ class PolicyPrediction(JSONSerializableBase):
     def action_names(self):
         return [action.name for action in self.actions]
 
+    @cached_property
+    def contains_listen(self) -> bool:
+        return any(action.name == ActionListen.name for action in self.actions)
+
+    @cached_property
+    def has_disable_session(self) -> bool:
+        return any(isinstance(action, ActionDisableSession) for action in self.actions)
+
 
 @json_serializable
 class ExtractedAction(BaseModel):
@@ -97,7 +97,7 @@ class StandardLLMPolicy(BaseLLMPolicy):
         return {
             "scope": self.scope,
             "actions": self.action_instruction,
-            "format_instructions": self.output_parser.get_format_instructions(),
+            "format_instructions": self.format_instructions,
             "intent_instruction": self.intent_instruction,
             "slots": slot_instruction(session),
             "conversations": conversation_history_instruction(session),
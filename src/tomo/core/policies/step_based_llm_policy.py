@@ -1,6 +1,7 @@
 # pylint: disable=C0301
 # Line too long
 
+from functools import cached_property
 import logging
 import textwrap
 from typing import Optional, Dict, Any, List
@@ -106,6 +107,10 @@ class StepBasedLLMPolicy(BaseLLMPolicy):
             system_prompt, session_prompt, self.output_parser
         )
 
+    @cached_property
+    def steps_instruction(self):
+        return step_descriptions(self.steps)
+
     async def run(self, session: Session) -> Optional[PolicyPrediction]:
         current_step_slot = session.slots.get("step")
         current_step_name = current_step_slot is not None and current_step_slot.value
@@ -127,9 +132,9 @@ class StepBasedLLMPolicy(BaseLLMPolicy):
             raise TomoFatalException(f"{current_step_name} isn't in step dictionary")
 
         return {
-            "step_descriptions": step_descriptions(self.steps),
+            "step_descriptions": self.steps_instruction,
             "actions": self.action_instruction,
-            "format_instructions": self.output_parser.get_format_instructions(),
+            "format_instructions": self.format_instructions,
             "current_step": current_step_instruction(current_step),
             "conversations": conversation_history_instruction(session),
             "slots": slot_instruction(session),
@@ -3,12 +3,13 @@ import logging
 import os
 import time
 import typing
+from collections import OrderedDict
+from contextlib import aclosing, contextmanager
 
 from tomo.core.actions import (
     Action,
     ActionDisableSession,
     ActionExtractSlots,
-    ActionListen,
     ActionSessionStart,
 )
 from tomo.core.events import ActionFailed, ActionExecuted, Event, Session, UserUttered
@@ -23,6 +24,9 @@ from tomo.shared.session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 MAX_NUMBER_OF_PREDICTIONS = int(os.environ.get("MAX_NUMBER_OF_PREDICTIONS", "100"))
+MAX_SESSION_LOCKS = int(os.environ.get("MAX_SESSION_LOCKS", "10000"))
+# The action is stateless, it can be shared by all the messages
+_EXTRACT_SLOTS_ACTION: Action = ActionExtractSlots()
 
 
 class MessageProcessor:
@@ -38,7 +42,7 @@ class MessageProcessor:
         # events and return values are used to update
         # the session state after an action has been taken
         try:
-            events = await action.run(output_channel, session) or []
+            events = await action.run(output_channel, session)
             events.append(
                 ActionExecuted(
                     action_name=action.name,
@@ -49,10 +53,11 @@ class MessageProcessor:
             )
         except Exception:
             logger.exception(
-                f"Encountered an exception while running action '{action.name}'."
+                "Encountered an exception while running action '%s'."
                 "Bot will continue, but the actions events are lost. "
                 "Please check the logs of your action server for "
-                "more information."
+                "more information.",
+                action.name,
             )
             events = [
                 ActionFailed(
@@ -74,6 +79,7 @@ class MessageProcessor:
         on_circuit_break: typing.Optional[typing.Callable] = None,
         nlu_parser: typing.Optional[NLUParser] = None,
         session_expiration: int = 86400 * 3,  # three days in second
+        max_session_locks: int = MAX_SESSION_LOCKS,
     ) -> None:
         """Initializes a `MessageProcessor`."""
         self.session_manager = session_manager
@@ -83,8 +89,14 @@ class MessageProcessor:
         self.nlu_parser = nlu_parser
         self.session_expiration = session_expiration
         self.policy_manager = policy_manager
+        self.max_session_locks = max_session_locks
         # TODO: use shared lock system
-        self._session_locks = {}
+        # session_id -> (lock, last used), least recently used first
+        self._session_locks: typing.OrderedDict[
+            str, typing.Tuple[asyncio.Lock, float]
+        ] = OrderedDict()
+        # session_id -> number of prediction loops using its lock
+        self._session_lock_users: typing.Dict[str, int] = {}
 
     async def start_new_session(
         self, session_id: str, output_channel: typing.Optional[OutputChannel]
@@ -99,7 +111,7 @@ class MessageProcessor:
         2. Run prediction and actions according to user's message until listen to user action.
         """
         session: Session = await self.log_message(message)
-        logger.debug(f"Session has been updated with user's message: {session}")
+        logger.debug("Session has been updated with user's message: %s", session)
 
         await self._run_prediction_loop(message.output_channel, session.session_id)
 
@@ -110,8 +122,8 @@ class MessageProcessor:
         1. Fetch the session from session store, it doesn't exist, then create a new one and run
            the session start action.
         2. Process user message and then apply user uterance event.
-        3. update session slot according to user message entities.
-        4. Save the update session with session manager.
+        3. update session slot according to user message entities, if there are any.
+        4. Save the update session with session manager, once for both steps.
 
         """
         session: Session = await self.get_session(
@@ -120,10 +132,13 @@ class MessageProcessor:
 
         await self._handle_message_with_session(message, session)
 
-        action_extract_slots: Action = ActionExtractSlots()
+        # Without entities there are no slots to set, only the message is saved
+        if not session.last_user_uttered_event().entities:
+            await self.save_session(session)
+            return session
 
         events = await self._run_action(
-            action_extract_slots, session, message.output_channel, None
+            _EXTRACT_SLOTS_ACTION, session, message.output_channel, None
         )
         await session.update_with_events(events)
 
@@ -154,7 +169,7 @@ class MessageProcessor:
         # action should be executed
         if (not session.events) and session.active:
             logger.debug(
-                f"Starting a new session for session ID '{session.session_id}'."
+                "Starting a new session for session ID '%s'.", session.session_id
             )
 
             action_session_start = ActionSessionStart("Hi, I'm your assistant Tomo")
@@ -181,6 +196,7 @@ class MessageProcessor:
 
         # don't ever directly mutate the session
         # - instead pass its events to log
+        # The session is persisted by `log_message` with the extracted slots
         await session.update_with_event(
             UserUttered(
                 message_id=message.message_id,
@@ -190,11 +206,12 @@ class MessageProcessor:
                 entities=parse_data["entities"],
                 timestamp=time.time(),
                 metadata=None,
-            )
+            ),
+            immediate_persist=False,
         )
 
         logger.debug(
-            f"Logged UserUtterance - session now has {len(session.events)} events."
+            "Logged UserUtterance - session now has %d events.", len(session.events)
         )
 
     async def save_session(self, session: Session) -> None:
@@ -205,16 +222,64 @@ class MessageProcessor:
         """
         await self.session_manager.save(session)
 
+    def _get_session_lock(self, session_id: str) -> asyncio.Lock:
+        """Return the lock of the session and evict the stale ones.
+
+        There is no await between the lookup and the insertion, so concurrent
+        coroutines always get the same lock for a session. The locks in use, see
+        `_use_session_lock`, are never evicted, they are moved back as if they had
+        just been used.
+        """
+        now = time.monotonic()
+        locks = self._session_locks
+        entry = locks.pop(session_id, None)
+        lock = entry[0] if entry else asyncio.Lock()
+        locks[session_id] = (lock, now)
+
+        # The lock just inserted is last, it is never reached
+        for _ in range(len(locks) - 1):
+            oldest_id, (oldest_lock, last_used) = next(iter(locks.items()))
+            if (
+                len(locks) <= self.max_session_locks
+                and now - last_used < self.session_expiration
+            ):
+                break
+            del locks[oldest_id]
+            # Held, or waited for: a new lock for the session would let a later
+            # message run alongside
+            if oldest_id in self._session_lock_users:
+                locks[oldest_id] = (oldest_lock, now)
+        return lock
+
+    @contextmanager
+    def _use_session_lock(self, session_id: str) -> typing.Iterator[asyncio.Lock]:
+        """Get the lock of the session, it isn't evicted until the block exits."""
+        users = self._session_lock_users
+        lock = self._get_session_lock(session_id)
+        users[session_id] = users.get(session_id, 0) + 1
+        try:
+            yield lock
+        finally:
+            users[session_id] -= 1
+            if not users[session_id]:
+                del users[session_id]
+
     # Prediction and action execution
     async def _run_prediction_loop(
         self, output_channel: OutputChannel, session_id: str
     ):
-        session_lock = self._session_locks.get(session_id)
-        if session_lock is None:
-            session_lock = asyncio.Lock()
-            self._session_locks[session_id] = session_lock
+        with self._use_session_lock(session_id) as session_lock:
+            await self._run_predictions(output_channel, session_id, session_lock)
 
+    async def _run_predictions(
+        self,
+        output_channel: OutputChannel,
+        session_id: str,
+        session_lock: asyncio.Lock,
+    ):
         async def _process(prediction: PolicyPrediction):
+            # Actions check the session state (e.g. whether the bot already replied),
+            # they have to see the events of the predictions processed before them.
             async with session_lock:
                 session = await self.session_manager.get_session(session_id)
                 events = await self._handle_prediction_with_session(
@@ -223,26 +288,35 @@ class MessageProcessor:
                 await session.update_with_events(events)
                 return events
 
-        async def _should_continue_loop(prediction: PolicyPrediction) -> bool:
-            return not ActionListen.name in prediction.action_names
-
         continue_loop = True
         while continue_loop:
             # TODO: Add lock
             session = await self.session_manager.get_session(session_id)
-            tasks: typing.List[asyncio.Task] = []
-            loop_continue_tests: typing.List[asyncio.Task] = []
-            async for prediction in self.policy_manager.run(session):
-                task = asyncio.create_task(_process(prediction))
-                tasks.append(task)
-                loop_continue_tests.append(
-                    asyncio.create_task(_should_continue_loop(prediction))
-                )
-
-            await asyncio.gather(*tasks)
-            test_results = await asyncio.gather(*loop_continue_tests)
-
-            continue_loop = len(test_results) > 0 and all(test_results)
+            predicted = False
+            # The check doesn't await, no need for a task per prediction
+            listen_predicted = False
+            # A failing prediction cancels its siblings instead of leaving them behind
+            try:
+                async with asyncio.TaskGroup() as tasks:
+                    # Every prediction of the round is processed, even after a listen:
+                    # they arrive in completion order, a fast policy predicting listen
+                    # must not drop the actions of a slower one.
+                    async with aclosing(
+                        self.policy_manager.run(session)
+                    ) as predictions:
+                        async for prediction in predictions:
+                            tasks.create_task(_process(prediction))
+                            predicted = True
+                            if prediction.contains_listen:
+                                listen_predicted = True
+            except ExceptionGroup as group:
+                # Callers handle the error of the policy or action itself, only
+                # errors raised at the same time are left grouped
+                if len(group.exceptions) == 1:
+                    raise group.exceptions[0] from None
+                raise
+
+            continue_loop = predicted and not listen_predicted
 
     async def _handle_prediction_with_session(
         self,
@@ -250,7 +324,11 @@ class MessageProcessor:
         output_channel: OutputChannel,
         session: Session,
     ):
-        logger.debug(f"processing prediction with actions: {prediction.action_names}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # action_names builds a list, only do it when it's logged
+            logger.debug(
+                "processing prediction with actions: %s", prediction.action_names
+            )
         actions = prediction.actions
         if actions is None or len(actions) == 0:
             return []
@@ -265,9 +343,8 @@ class MessageProcessor:
             return []
 
         # If there is an action to disable the session, run it immediately
-        for action in actions:
-            if not isinstance(action, ActionDisableSession):
-                continue
+        if prediction.has_disable_session:
+            action = next(a for a in actions if isinstance(a, ActionDisableSession))
             events = await self._run_action(
                 action,
                 session,
@@ -284,6 +361,6 @@ class MessageProcessor:
                 output_channel=output_channel,
                 policy_name=prediction.policy_name,
             )
-            events.extend(_events or [])
+            events.extend(_events)
 
         return events
@@ -1,14 +1,19 @@
-import json
+import asyncio
+import io
 import logging
 import os
+import pickle
 import time
-from copy import deepcopy
+from collections import OrderedDict, deque
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
-import glob
+from typing import Deque, Optional, Dict, List, Tuple
+from weakref import WeakValueDictionary
 
+import orjson
 from aiofiles import open as aio_open
-from aiofiles.os import remove as aio_remove
+from aiofiles.os import remove as aio_remove, replace as aio_replace, stat as aio_stat
 
 from tomo.assistant import Assistant
 from tomo.core.events import BotUttered, UserUttered
@@ -22,6 +27,37 @@ from tomo.utils.json import JsonFormat
 
 logger = logging.getLogger(__name__)
 
+# Bound on the session files opened at once by bulk operations
+MAX_CONCURRENT_FILE_OPERATIONS = 32
+
+# Seconds before a failed session write is tried again, doubled up to the maximum
+WRITE_RETRY_DELAY = 1.0
+MAX_WRITE_RETRY_DELAY = 60.0
+
+# Size in bytes of the events log past which the whole session is written again,
+# the log is replayed every time the session is loaded
+EVENTS_LOG_CHECKPOINT_SIZE = 256 * 1024
+
+JSON_SERIALIZATION = "json"
+PICKLE_SERIALIZATION = "pickle"
+# Session file extension used by default for each serialization
+SERIALIZATION_EXTENSIONS = {
+    JSON_SERIALIZATION: ".json",
+    PICKLE_SERIALIZATION: ".pickle",
+}
+
+# Deletes the ASCII characters not allowed in session file names
+_UNSAFE_ASCII_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if not (c.isalnum() or c in "-_"))
+)
+
+
+@lru_cache(maxsize=1024)
+def _safe_session_id(session_id: str) -> str:
+    if session_id.isascii():
+        return session_id.translate(_UNSAFE_ASCII_TABLE)
+    return "".join(c for c in session_id if c.isalnum() or c in ("-", "_"))
+
 
 class FileSession(Session):
     """Session implementation that works with FileSessionManager"""
@@ -46,6 +82,13 @@ class FileSession(Session):
             session_id=session_id, max_event_history=max_event_history, slots=slots
         )
         self.session_manager: "FileSessionManager" = session_manager
+        # Kept up to date as events are appended instead of scanning the history
+        self._last_user_uttered: Optional[UserUttered] = None
+        self._last_bot_uttered: Optional[BotUttered] = None
+        self._bot_replied = False
+        # (message type, event) of the user and bot messages in the history
+        self._conversation: Deque[Tuple[str, Event]] = deque()
+        self._appended = 0
 
     async def update_with_event(
         self, event: Event, immediate_persist: bool = True
@@ -62,14 +105,22 @@ class FileSession(Session):
                 "session_manager isn't defined in this instance, event cannot be applied."
             )
 
-        event.apply_to(self)
+        if not event._is_noop:  # pylint: disable=W0212
+            event.apply_to(self)
+        if self.events and len(self.events) == self.events.maxlen:
+            # The oldest event falls out of the bounded history
+            self._forget_event(self.events[0])
         self.events.append(event)
+        self._track_event(event)
         logger.debug(
-            f"Event {event.__class__.__name__} has been applied to session {self.session_id}"
+            "Event %s has been applied to session %s",
+            event.__class__.__name__,
+            self.session_id,
         )
 
         if immediate_persist:
-            persisted_session = await self.session_manager.save(self)
+            # Only the new event is written, not the whole session
+            persisted_session = await self.session_manager.append_events(self, [event])
             return persisted_session
         return self
 
@@ -95,25 +146,67 @@ class FileSession(Session):
                 e.timestamp = time.time()
             await self.update_with_event(e, immediate_persist=False)
 
-        # Save all changes at once
-        persisted_session = await self.session_manager.save(self)
+        # Only the new events are written, at once
+        persisted_session = await self.session_manager.append_events(self, new_events)
         return persisted_session
 
+    def copy(self) -> "FileSession":
+        session = super().copy()
+        session._conversation = deque(self._conversation)
+        return session
+
+    def _track_event(self, event: Event) -> None:
+        if isinstance(event, UserUttered):
+            self._last_user_uttered = event
+            self._bot_replied = False
+            self._conversation.append(("user", event))
+        elif isinstance(event, BotUttered):
+            self._last_bot_uttered = event
+            self._bot_replied = True
+            self._conversation.append(("bot", event))
+        self._appended += 1
+
+    def _forget_event(self, event: Event) -> None:
+        """Stop referring to an event which is no longer in the history"""
+        if event is self._last_user_uttered:
+            self._last_user_uttered = None
+        if event is self._last_bot_uttered:
+            # Every later event is a reply to nothing the history still holds
+            self._last_bot_uttered = None
+            self._bot_replied = False
+        if self._conversation and self._conversation[0][1] is event:
+            self._conversation.popleft()
+
+    def restore_events(
+        self, events: List[Event], appended: Optional[int] = None
+    ) -> None:
+        """
+        Replace the event history with events loaded from storage
+
+        Args:
+            events: The stored events, oldest first
+            appended: Number of events ever appended to the session, defaults to the
+                number of stored events
+        """
+        self.events = deque(events, maxlen=self.max_event_history)
+        if appended is None:
+            appended = len(events)
+        # Positions of the events which fell out of a bounded history are skipped
+        self._appended = appended - len(self.events)
+        self._last_user_uttered = None
+        self._last_bot_uttered = None
+        self._bot_replied = False
+        self._conversation = deque()
+        for event in self.events:
+            self._track_event(event)
+
     def last_user_uttered_event(self) -> Optional[Event]:
         """Get the most recent UserUttered event"""
-        for event in reversed(self.events):
-            if isinstance(event, UserUttered):
-                return event
-        return None
+        return self._last_user_uttered
 
     def has_bot_replied(self) -> bool:
         """Check if the bot has replied since the last user message"""
-        for event in reversed(self.events):
-            if isinstance(event, BotUttered):
-                return True
-            if isinstance(event, UserUttered):
-                return False
-        return False
+        return self._bot_replied
 
     def get_events_after(self, timestamp: float) -> List[Event]:
         """
@@ -125,6 +218,8 @@ class FileSession(Session):
         Returns:
             List of events after the timestamp
         """
+        # No bisect, events may carry the time they were created rather than applied
+        # so nothing guarantees the history is sorted by timestamp
         return [event for event in self.events if event.timestamp > timestamp]
 
     def get_conversation_messages(self) -> List[Dict]:
@@ -134,18 +229,20 @@ class FileSession(Session):
         Returns:
             List of message dictionaries
         """
+        # The message type was found when the event was appended
         messages = []
-        for event in self.events:
-            if isinstance(event, (UserUttered, BotUttered)):
-                message = {
-                    "text": event.text,
-                    "timestamp": event.timestamp,
-                    "type": "user" if isinstance(event, UserUttered) else "bot",
-                }
-                if hasattr(event, "metadata") and event.metadata:
-                    message["metadata"] = event.metadata
-                messages.append(message)
-        return message
+        append = messages.append
+        for message_type, event in self._conversation:
+            message = {
+                "text": event.text,
+                "timestamp": event.timestamp,
+                "type": message_type,
+            }
+            metadata = event.metadata
+            if metadata:
+                message["metadata"] = metadata
+            append(message)
+        return messages
 
 
 class FileSessionManager(SessionManager):
@@ -155,7 +252,10 @@ class FileSessionManager(SessionManager):
         self,
         assistant: Assistant,
         storage_path: str = "sessions",
-        file_extension: str = ".json",
+        file_extension: Optional[str] = None,
+        cache_size: int = 1024,
+        write_delay: float = 0.01,
+        serialization: str = JSON_SERIALIZATION,
     ):
         """
         Initialize the file session manager
@@ -163,33 +263,136 @@ class FileSessionManager(SessionManager):
         Args:
             assistant: The assistant instance containing slot definitions
             storage_path: Directory path where session files will be stored
-            file_extension: File extension for session files
+            file_extension: File extension for session files, defaults to the one
+                of the serialization
+            cache_size: Maximum number of loaded sessions kept in memory
+            write_delay: Seconds a saved session waits before being written, all
+                the saves of a session during that time are written at once
+            serialization: "json", or "pickle" to store the events and slots as
+                Python objects instead of converting them from and to JSON. Only
+                use pickle when the storage directory is trusted.
         """
+        if serialization not in SERIALIZATION_EXTENSIONS:
+            raise ValueError(f"Unknown session serialization: {serialization}")
         self.assistant = assistant
         self.storage_path = Path(storage_path)
-        self.file_extension = file_extension
+        self.serialization = serialization
+        self.file_extension = file_extension or SERIALIZATION_EXTENSIONS[serialization]
+        self.cache_size = cache_size
+        self.write_delay = write_delay
+        # session_id -> (files version, session), least recently used first
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], Session]]" = OrderedDict()
+        # Saved sessions waiting to be written, and the tasks writing them
+        self._dirty: Dict[str, Session] = {}
+        self._pending: Dict[str, asyncio.Task] = {}
+        # Serializes the writes of a session, dropped once nobody holds the lock
+        self._file_locks: "WeakValueDictionary[str, asyncio.Lock]" = (
+            WeakValueDictionary()
+        )
         self._ensure_storage_exists()
 
     def _ensure_storage_exists(self):
         """Ensure the storage directory exists"""
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+    def _scan_session_files(self, stat: bool = False) -> List[os.DirEntry]:
+        """
+        List the session files of the storage directory, blocking: run it in a thread
+
+        Args:
+            stat: Whether to also stat the files, `entry.stat()` then returns the
+                result kept by the entry
+        """
+        # The file type comes with the directory read, but the stat of each file
+        # is one more system call
+        with os.scandir(self.storage_path) as entries:
+            session_files = [
+                entry
+                for entry in entries
+                if entry.name.endswith(self.file_extension) and entry.is_file()
+            ]
+        if stat:
+            for entry in session_files:
+                entry.stat()
+        return session_files
+
     def _get_session_path(self, session_id: str) -> Path:
         """Get the full path for a session file"""
-        safe_session_id = "".join(
-            c for c in session_id if c.isalnum() or c in ("-", "_")
-        )
+        safe_session_id = _safe_session_id(session_id)
         return self.storage_path / f"{safe_session_id}{self.file_extension}"
 
+    def _get_events_log_path(self, session_path: Path) -> Path:
+        """Get the path of the log of events appended since the session was saved"""
+        return session_path.with_name(f"{session_path.name}.events")
+
+    def _file_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self._file_locks.get(session_id)
+        if lock is None:
+            lock = self._file_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def _file_version(self, session_id: str) -> Optional[Tuple[int, int]]:
+        """Get the session file mtime and events log size, None without session file"""
+        session_path = self._get_session_path(session_id)
+        try:
+            mtime = (await aio_stat(session_path)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        log_path = self._get_events_log_path(session_path)
+        try:
+            log_size = (await aio_stat(log_path)).st_size
+        except FileNotFoundError:
+            log_size = 0
+        return mtime, log_size
+
+    async def _read_events_log(self, log_path: Path) -> List[Tuple[int, List[Event]]]:
+        """
+        Read the batches of events appended to a session file with the history
+        position of their first event
+
+        Called with the file lock held. A last record cut short by a crash during an
+        append is skipped and truncated from the log.
+        """
+        try:
+            async with aio_open(log_path, "rb") as file:
+                content = await file.read()
+        except FileNotFoundError:
+            return []
+        records = []
+        if self.serialization == PICKLE_SERIALIZATION:
+            # The records are pickled one after another
+            stream = io.BytesIO(content)
+            complete = 0
+            try:
+                while complete < len(content):
+                    records.append(pickle.load(stream))
+                    complete = stream.tell()
+            except (EOFError, pickle.UnpicklingError):
+                pass
+        else:
+            # Every complete record ends with a newline
+            complete = content.rfind(b"\n") + 1
+            for line in content[:complete].splitlines():
+                if line:
+                    record = orjson.loads(line)
+                    events = [JsonFormat.from_json(event) for event in record["events"]]
+                    records.append((record["position"], events))
+        if complete < len(content):
+            logger.warning(f"Skipping the incomplete last record of {log_path}")
+            # The next append would be glued to it
+            async with aio_open(log_path, "r+b") as file:
+                await file.truncate(complete)
+        return records
+
     async def _read_session_file(self, file_path: Path) -> Optional[dict]:
         """Read and parse a session file"""
         try:
-            async with aio_open(file_path, "r") as file:
+            async with aio_open(file_path, "rb") as file:
                 content = await file.read()
-                return json.loads(content)
+                return self._loads(content)
         except FileNotFoundError:
             return None
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, pickle.UnpicklingError) as e:
             logger.error(f"Error decoding session file {file_path}: {e}")
             return None
         except Exception as e:
@@ -199,8 +402,12 @@ class FileSessionManager(SessionManager):
     async def _write_session_file(self, file_path: Path, session_data: dict):
         """Write session data to file"""
         try:
-            async with aio_open(file_path, "w") as file:
-                await file.write(json.dumps(session_data, indent=2))
+            content = self._dumps(session_data)
+            # Replacing the file is atomic, a crash never leaves it half written
+            temp_path = file_path.with_name(f"{file_path.name}.tmp")
+            async with aio_open(temp_path, "wb") as file:
+                await file.write(content)
+            await aio_replace(temp_path, file_path)
         except Exception as e:
             logger.error(f"Error writing session file {file_path}: {e}")
             raise TomoException(f"Failed to save session: {e}") from e
@@ -222,7 +429,8 @@ class FileSessionManager(SessionManager):
         if session is None:
             logger.info(f"creating new session {session_id}")
             # Initialize new session with assistant slots
-            slots = {slot.name: deepcopy(slot) for slot in self.assistant.slots}
+            # Slot values are replaced, never mutated, a shallow copy is enough
+            slots = {slot.name: copy(slot) for slot in self.assistant.slots}
             session = FileSession(
                 session_manager=self,
                 session_id=session_id,
@@ -242,35 +450,194 @@ class FileSessionManager(SessionManager):
         Returns:
             The session instance if found, None otherwise
         """
+        # Not written yet, the files are behind
+        dirty = self._dirty.get(session_id)
+        if dirty is not None:
+            return dirty
+
+        version = await self._file_version(session_id)
+        if version is None:
+            self._cache.pop(session_id, None)
+            return None
+
+        # The files haven't changed since they were loaded or written, reuse the session
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[0] == version:
+            self._cache.move_to_end(session_id)
+            return cached[1]
+
         file_path = self._get_session_path(session_id)
-        session_data = await self._read_session_file(file_path)
+        # An append in progress would look like a record cut short by a crash
+        async with self._file_lock(session_id):
+            session_data = await self._read_session_file(file_path)
 
-        if session_data is None:
-            return None
+            if session_data is None:
+                return None
 
-        try:
-            return self.from_dict(session_data)
-        except Exception as e:
-            logger.error(f"Error deserializing session {session_id}: {e}")
-            raise e
+            try:
+                session = self.from_dict(session_data)
+                for first_position, events in await self._read_events_log(
+                    self._get_events_log_path(file_path)
+                ):
+                    for position, event in enumerate(events, first_position):
+                        # Left over by a crash after the session file was written,
+                        # the event is already part of it
+                        if position < session._appended:  # pylint: disable=W0212
+                            continue
+                        await session.update_with_event(event, immediate_persist=False)
+            except Exception as e:
+                logger.error(f"Error deserializing session {session_id}: {e}")
+                raise e
+        self._cache_session(session, version)
+        return session
+
+    def _cache_session(self, session: Session, version: Tuple[int, int]) -> None:
+        self._cache[session.session_id] = (version, session)
+        self._cache.move_to_end(session.session_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     async def save(self, session: Session) -> Session:
         """
         Save a session to file
 
+        The file is written after `write_delay`, use `flush` to write it right away.
+        Failed writes are retried in the background and raised by `flush`.
+
         Args:
             session: The session to save
 
         Returns:
             The saved session instance
         """
+        session_id = session.session_id
+        self._dirty[session_id] = session
+        if session_id not in self._pending:
+            self._schedule_write(session_id, self.write_delay)
+        return session
+
+    async def flush(self) -> None:
+        """
+        Write all the saved sessions which are still waiting, e.g. before shutdown
+
+        Raises:
+            TomoException: If a session can't be written, it's retried later on
+        """
+        # The scheduled writes are still sleeping, do them now instead
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        results = await asyncio.gather(
+            *(self._write_dirty(session_id) for session_id in list(self._dirty)),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            for session_id in self._dirty:
+                if session_id not in self._pending:
+                    self._schedule_write(session_id, WRITE_RETRY_DELAY)
+            raise errors[0]
+
+    def _schedule_write(self, session_id: str, delay: float) -> None:
+        self._pending[session_id] = asyncio.create_task(
+            self._write_after_delay(session_id, delay)
+        )
+
+    async def _write_after_delay(self, session_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # Saves from now on need another write
+        del self._pending[session_id]
+        try:
+            await self._write_dirty(session_id)
+        except TomoException:
+            # Already logged, the session stays dirty and is written again later
+            if session_id in self._dirty and session_id not in self._pending:
+                retry_delay = max(delay * 2, WRITE_RETRY_DELAY)
+                self._schedule_write(
+                    session_id, min(retry_delay, MAX_WRITE_RETRY_DELAY)
+                )
+
+    async def _write_dirty(self, session_id: str) -> None:
+        session = self._dirty.get(session_id)
+        if session is None:
+            return
+        await self._write_session(session)
+        if self._dirty.get(session_id) is session and session_id not in self._pending:
+            del self._dirty[session_id]
+
+    async def _write_session(self, session: Session) -> None:
         file_path = self._get_session_path(session.session_id)
 
-        # Add metadata for session management
-        session_data = self.to_dict(session)
-        session_data["_metadata"] = {"last_modified": time.time()}
+        async with self._file_lock(session.session_id):
+            # Add metadata for session management
+            last_modified = time.time()
+            try:
+                session_data = self.to_dict(session)
+            except Exception as e:
+                logger.error(f"Error serializing session {session.session_id}: {e}")
+                raise TomoException(f"Failed to save session: {e}") from e
+            session_data["_metadata"] = {"last_modified": last_modified}
+
+            await self._write_session_file(file_path, session_data)
+            # The appended events are part of the session file now. If the process
+            # stops before the log is removed, their positions tell they are saved.
+            try:
+                await aio_remove(self._get_events_log_path(file_path))
+            except FileNotFoundError:
+                pass
+            self._cache_session(session, await self._file_version(session.session_id))
+
+    async def append_events(self, session: Session, events: List[Event]) -> Session:
+        """
+        Persist events already applied to the session by appending them to the log
+
+        The events are written as a single record, after a crash they are replayed
+        all together or not at all.
+
+        Args:
+            session: The session the events belong to
+            events: The new events, the last ones of the history
+
+        Returns:
+            The saved session instance
+        """
+        session_id = session.session_id
+        if session_id in self._dirty or session_id not in self._cache:
+            # The session file is missing or stale, write everything. Saving again
+            # when it's already dirty matters: a write in progress may have
+            # serialized the session before the events and would then clear it.
+            return await self.save(session)
+        if not events:
+            return session
+
+        position = session._appended - len(events)  # pylint: disable=W0212
+        if self.serialization == PICKLE_SERIALIZATION:
+            record = pickle.dumps(
+                (position, list(events)), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        else:
+            record = orjson.dumps(
+                {
+                    "position": position,
+                    "events": [JsonFormat.to_json(event) for event in events],
+                }
+            )
+            record += b"\n"
+        log_path = self._get_events_log_path(self._get_session_path(session_id))
+        async with self._file_lock(session_id):
+            try:
+                async with aio_open(log_path, "ab") as file:
+                    await file.write(record)
+            except Exception as e:
+                logger.error(f"Error appending to session {session_id}: {e}")
+                raise TomoException(f"Failed to save session: {e}") from e
+            version = await self._file_version(session_id)
+            self._cache_session(session, version)
 
-        await self._write_session_file(file_path, session_data)
+        if version is not None and version[1] > EVENTS_LOG_CHECKPOINT_SIZE:
+            # Writing the whole session replaces the log
+            await self.save(session)
         return session
 
     async def delete_session(self, session_id: str) -> None:
@@ -280,14 +647,22 @@ class FileSessionManager(SessionManager):
         Args:
             session_id: The session identifier to delete
         """
+        self._dirty.pop(session_id, None)
+        self._cache.pop(session_id, None)
         file_path = self._get_session_path(session_id)
-        try:
-            await aio_remove(file_path)
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            logger.error(f"Error deleting session file {file_path}: {e}")
-            raise TomoException(f"Failed to delete session: {e}") from e
+        # Wait for a write in progress, it would create the file again
+        async with self._file_lock(session_id):
+            try:
+                await aio_remove(self._get_events_log_path(file_path))
+            except FileNotFoundError:
+                pass
+            try:
+                await aio_remove(file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.error(f"Error deleting session file {file_path}: {e}")
+                raise TomoException(f"Failed to delete session: {e}") from e
 
     async def cleanup_old_sessions(self, max_age_days: int = 30) -> None:
         """
@@ -296,24 +671,35 @@ class FileSessionManager(SessionManager):
         Args:
             max_age_days: Maximum age of sessions in days
         """
+        await self.flush()
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
-
-        # Get all session files
-        pattern = str(self.storage_path / f"*{self.file_extension}")
-        session_files = glob.glob(pattern)
-
-        for file_path in session_files:
-            try:
-                session_data = await self._read_session_file(Path(file_path))
-                if (
-                    session_data
-                    and session_data.get("_metadata", {}).get("last_modified", 0)
-                    < cutoff_time
-                ):
-                    await aio_remove(file_path)
-                    logger.info(f"Deleted old session file: {file_path}")
-            except Exception as e:
-                logger.error(f"Error cleaning up session file {file_path}: {e}")
+        # Files are handled concurrently, bounded so they don't exhaust descriptors
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_OPERATIONS)
+
+        async def _cleanup(entry: os.DirEntry) -> None:
+            async with semaphore:
+                try:
+                    # The file system tracks when the session was last written,
+                    # no need to parse the file
+                    log_path = self._get_events_log_path(Path(entry.path))
+                    last_modified = entry.stat().st_mtime
+                    try:
+                        log_modified = (await aio_stat(log_path)).st_mtime
+                        last_modified = max(last_modified, log_modified)
+                    except FileNotFoundError:
+                        pass
+                    if last_modified < cutoff_time:
+                        await aio_remove(entry.path)
+                        try:
+                            await aio_remove(log_path)
+                        except FileNotFoundError:
+                            pass
+                        logger.info(f"Deleted old session file: {entry.path}")
+                except Exception as e:
+                    logger.error(f"Error cleaning up session file {entry.path}: {e}")
+
+        session_files = await asyncio.to_thread(self._scan_session_files, stat=True)
+        await asyncio.gather(*(_cleanup(entry) for entry in session_files))
 
     async def list_sessions(self) -> list[str]:
         """
@@ -322,9 +708,10 @@ class FileSessionManager(SessionManager):
         Returns:
             List of session IDs
         """
-        pattern = str(self.storage_path / f"*{self.file_extension}")
-        session_files = glob.glob(pattern)
-        return [Path(f).stem for f in session_files]
+        await self.flush()
+        extension_length = len(self.file_extension)
+        session_files = await asyncio.to_thread(self._scan_session_files)
+        return [entry.name[:-extension_length] for entry in session_files]
 
     async def get_session_stats(self) -> dict:
         """
@@ -333,55 +720,70 @@ class FileSessionManager(SessionManager):
         Returns:
             Dictionary containing session statistics
         """
-        total_sessions = 0
-        active_sessions = 0
-        total_size = 0
-
-        pattern = str(self.storage_path / f"*{self.file_extension}")
-        session_files = glob.glob(pattern)
+        await self.flush()
+        session_files = await asyncio.to_thread(self._scan_session_files, stat=True)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_OPERATIONS)
 
-        for file_path in session_files:
-            total_sessions += 1
-            total_size += os.path.getsize(file_path)
-
-            try:
-                session_data = await self._read_session_file(Path(file_path))
-                if session_data and session_data.get("active", False):
-                    active_sessions += 1
-            except Exception:
-                continue
+        async def _is_active(entry: os.DirEntry) -> bool:
+            async with semaphore:
+                session_data = await self._read_session_file(Path(entry.path))
+                return bool(session_data and session_data.get("active", False))
 
+        active = await asyncio.gather(*(_is_active(entry) for entry in session_files))
         return {
-            "total_sessions": total_sessions,
-            "active_sessions": active_sessions,
-            "total_size_bytes": total_size,
+            "total_sessions": len(session_files),
+            "active_sessions": sum(active),
+            "total_size_bytes": sum(entry.stat().st_size for entry in session_files),
             "storage_path": str(self.storage_path),
         }
 
+    def _dumps(self, data: dict) -> bytes:
+        if self.serialization == PICKLE_SERIALIZATION:
+            return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        return orjson.dumps(data)
+
+    def _loads(self, content: bytes) -> dict:
+        if self.serialization == PICKLE_SERIALIZATION:
+            return pickle.loads(content)
+        return orjson.loads(content)
+
     def to_dict(self, session: Session):
+        if self.serialization == PICKLE_SERIALIZATION:
+            # Pickle stores the objects themselves
+            events = list(session.events)
+            slots = dict(session.slots)
+        else:
+            events = [JsonFormat.to_json(event) for event in session.events]
+            slots = {
+                key: JsonFormat.to_json(slot) for key, slot in session.slots.items()
+            }
         return {
             "session_id": session.session_id,
             "max_event_history": session.max_event_history,
-            "events": [JsonFormat.to_json(event) for event in session.events],
-            "slots": {
-                key: JsonFormat.to_json(slot) for key, slot in session.slots.items()
-            },
+            "events": events,
+            "slots": slots,
             "active": session.active,
+            # Events of the log at lower positions are included in the session file
+            "appended": session._appended,  # pylint: disable=W0212
         }
 
     def from_dict(self, data: dict):
         session_id = data["session_id"]
         max_event_history = data.get("max_event_history")
-        events = [JsonFormat.from_json(event_data) for event_data in data["events"]]
-        slots = {
-            key: JsonFormat.from_json(slot_data)
-            for key, slot_data in data["slots"].items()
-        }
+        if self.serialization == PICKLE_SERIALIZATION:
+            events = data["events"]
+            slots = data["slots"]
+        else:
+            events = [JsonFormat.from_json(event_data) for event_data in data["events"]]
+            slots = {
+                key: JsonFormat.from_json(slot_data)
+                for key, slot_data in data["slots"].items()
+            }
         active = data.get("active")
         session = FileSession(
             self, session_id, max_event_history=max_event_history, slots=slots
         )
-        session.events = events
+        session.restore_events(events, data.get("appended"))
         session.active = active
 
         return session
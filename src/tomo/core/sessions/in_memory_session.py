@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 import logging
 import time
 from typing import Dict, List, Optional
@@ -27,6 +27,10 @@ class InMemorySession(Session):
             session_id=session_id, max_event_history=max_event_history, slots=slots
         )
         self.session_manager: SessionManager = session_manager
+        # Kept up to date as events are appended instead of scanning the history
+        self._last_user_uttered: Optional[UserUttered] = None
+        self._last_bot_uttered: Optional[BotUttered] = None
+        self._bot_replied = False
 
     async def update_with_event(self, event: Event, immediate_persist=True) -> None:
         """
@@ -40,9 +44,14 @@ class InMemorySession(Session):
                 "session_manager isn't defined in this instance, event cannot be applied."
             )
 
-        event.apply_to(self)
+        if not event._is_noop:  # pylint: disable=W0212
+            event.apply_to(self)
+        if self.events and len(self.events) == self.events.maxlen:
+            # Appending drops the oldest event of a full history
+            self._forget_event(self.events[0])
         self.events.append(event)
-        logger.debug(f"Event {event.__class__} has been applied.")
+        self._track_event(event)
+        logger.debug("Event %s has been applied.", event.__class__)
         if immediate_persist:
             persisted_sesson = await self.session_manager.save(self)
             return persisted_sesson
@@ -67,19 +76,27 @@ class InMemorySession(Session):
         persisted_sesson = await self.session_manager.save(self)
         return persisted_sesson
 
+    def _track_event(self, event: Event) -> None:
+        if isinstance(event, UserUttered):
+            self._last_user_uttered = event
+            self._bot_replied = False
+        elif isinstance(event, BotUttered):
+            self._last_bot_uttered = event
+            self._bot_replied = True
+
+    def _forget_event(self, event: Event) -> None:
+        if event is self._last_user_uttered:
+            self._last_user_uttered = None
+        if event is self._last_bot_uttered:
+            # The events after the last bot message don't include a reply
+            self._last_bot_uttered = None
+            self._bot_replied = False
+
     def last_user_uttered_event(self) -> Optional["Event"]:
-        for event in reversed(self.events):
-            if isinstance(event, UserUttered):
-                return event
-        return None
+        return self._last_user_uttered
 
     def has_bot_replied(self) -> bool:
-        for event in reversed(self.events):
-            if isinstance(event, BotUttered):
-                return True
-            if isinstance(event, UserUttered):
-                return False
-        return False
+        return self._bot_replied
 
 
 class InMemorySessionManager:
@@ -109,7 +126,8 @@ class InMemorySessionManager:
             The session object.
         """
         if session_id not in self.sessions:
-            slots = {slot.name: deepcopy(slot) for slot in self.assistant.slots}
+            # Slots get new values assigned, the values themselves are never modified
+            slots = {slot.name: copy(slot) for slot in self.assistant.slots}
             session = InMemorySession(
                 self, session_id, max_event_history=max_event_history, slots=slots
             )
@@ -3,6 +3,7 @@
 
 from functools import cached_property
 import logging
+import sys
 import textwrap
 from typing import Any, Dict, List, Optional
 
@@ -55,6 +56,16 @@ class NLUParser(BaseLLMComponent):
         """
         )
 
+        # The intents and the format instructions don't change between requests,
+        # render them into the template once so only the session parts are formatted.
+        static_inputs = {
+            "intents": self.intent_instruction,
+            "format_instructions": self.output_parser.get_format_instructions(),
+        }
+        for name, value in static_inputs.items():
+            escaped = value.replace("{", "{{").replace("}", "}}")
+            system_prompt = system_prompt.replace(f"{{{name}}}", escaped)
+
         self.llm_chain = self._setup_chain(
             system_prompt, "{user_input}", self.output_parser
         )
@@ -66,31 +77,46 @@ class NLUParser(BaseLLMComponent):
             for intent in self.intents
         )
 
+    def _get_inputs(self, message: UserMessage, session: Session) -> Dict[str, Any]:
+        inputs = {
+            "user_input": message.text,
+            "slots": slot_instruction(session, only_extractable=True),
+            "conversation_history": conversation_history_instruction(session),
+        }
+        return inputs
+
+    async def _save_nlu_prompts(self, inputs: Dict[str, Any], session: Session):
+        final_prompt = self.prompt.format_messages(**inputs)
+        await self._save_prompts(
+            session.session_id, [msg.content for msg in final_prompt], "nlu"
+        )
+
+    @staticmethod
+    def _to_parse_data(result: Dict) -> Dict:
+        intent = result.get("intent")
+        entities = result.get("entities", [])
+        for entity in entities:
+            # Entity names are compared with slot names, which are interned at config load
+            entity["name"] = sys.intern(entity["name"])
+
+        return {
+            "intent": intent and IntentExtraction(**intent),
+            "entities": [Entity(**entity) for entity in entities],
+        }
+
+    @staticmethod
+    def _unknown_parse_data() -> Dict:
+        return {"intent": IntentExtraction(name="unknown"), "entities": []}
+
     async def parse(self, message: UserMessage, session: Session) -> Dict:
         try:
-            inputs = {
-                "user_input": message.text,
-                "intents": self.intent_instruction,
-                "slots": slot_instruction(session, only_extractable=True),
-                "conversation_history": conversation_history_instruction(session),
-                "format_instructions": self.output_parser.get_format_instructions(),
-            }
-
+            inputs = self._get_inputs(message, session)
             if self.local_test:
-                final_prompt = self.prompt.format_messages(**inputs)
-                self._save_prompts(
-                    session.session_id, [msg.content for msg in final_prompt], "nlu"
-                )
-
-            result = self.llm_chain.invoke(inputs)
-            intent = result.get("intent")
-            entities = result.get("entities", [])
+                await self._save_nlu_prompts(inputs, session)
 
-            return {
-                "intent": intent and IntentExtraction(**intent),
-                "entities": [Entity(**entity) for entity in entities],
-            }
+            result = await self._ainvoke(inputs)
+            return self._to_parse_data(result)
 
         except Exception as e:
             logger.error(f"Error processing message with LLM: {e}", exc_info=True)
-            return {"intent": {"name": "unknown", "confidence": 0.0}, "entities": []}
+            return self._unknown_parse_data()
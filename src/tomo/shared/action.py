@@ -12,12 +12,22 @@ logger = logging.getLogger(__name__)
 
 class Action(abc.ABC, JSONSerializableBase):
     subclasses = {}
+    # Callables importing the modules of lazily loaded actions, they are run once
+    # the first time an unknown action is looked up.
+    lazy_loaders: typing.ClassVar[typing.List[typing.Callable[[], None]]] = []
+    # Slots which must be filled before running the action
+    required_slots: typing.ClassVar[typing.Tuple[str, ...]] = ()
 
     @classmethod
     def get_action_cls(cls, action_name):
-        if action_name not in cls.subclasses:
+        action_cls = cls.subclasses.get(action_name)
+        if action_cls is None and Action.lazy_loaders:
+            while Action.lazy_loaders:
+                Action.lazy_loaders.pop()()
+            action_cls = cls.subclasses.get(action_name)
+        if action_cls is None:
             raise ValueError(f"Unknown action: {action_name}")
-        return cls.subclasses[action_name]
+        return action_cls
 
     @classmethod
     def create(cls, action_name, **kwargs):
@@ -41,15 +51,11 @@ class Action(abc.ABC, JSONSerializableBase):
     def description(self):
         pass
 
-    @classmethod
-    def required_slots(cls):
-        return []
-
     @abc.abstractmethod
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
-        pass
+    ) -> typing.List[Event]:
+        """Run the action and return a new list of the events to apply."""
 
 
 class DummyAction(Action):
@@ -58,6 +64,6 @@ class DummyAction(Action):
 
     async def run(
         self, output_channel: OutputChannel, session: Session
-    ) -> typing.Optional[typing.List[Event]]:
+    ) -> typing.List[Event]:
         logger.info("Executing dummy action")
         return []
@@ -5,10 +5,10 @@ from dataclasses import dataclass
 from tomo.utils.json import json_serializable
 
 
-@dataclass
 @json_serializable
+@dataclass(slots=True, kw_only=True, frozen=True)
 class BotMessage:
-    recipient_id: typing.Optional[str]
+    recipient_id: typing.Optional[str] = None
     text: typing.Optional[str] = None
     quick_replies: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
     buttons: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
@@ -16,6 +16,6 @@ class BotMessage:
     image: typing.Optional[str] = None
     attachment: typing.Optional[str] = None
     elements: typing.Optional[typing.List[typing.Dict[str, typing.Any]]] = None
-    additional_properties: typing.Dict[str, typing.Any] = dataclasses.field(
+    additional_properties: typing.Mapping[str, typing.Any] = dataclasses.field(
         default_factory=dict
     )
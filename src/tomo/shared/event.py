@@ -1,25 +1,35 @@
 import abc
-import json
 import typing
+from dataclasses import dataclass
 
-from tomo.utils.json import JSONSerializableBase, JsonFormat
+from tomo.utils.json import JsonFormat, json_serializable
 
 if typing.TYPE_CHECKING:
     from tomo.shared.session import Session  # Forward declaration for Event
 
 
-class Event(abc.ABC, JSONSerializableBase):
+@json_serializable
+@dataclass(slots=True)
+class Event(abc.ABC):
     """
     Base class for events that occur during a session.
 
     Events represent any significant occurrences in the conversation,
     such as a user message, bot response, or slot being set. Each event
     carries metadata and can be applied to the session to update its state.
+
+    Sessions keep every event in their history, so subclasses should be declared
+    with `@json_serializable` and `@dataclass(slots=True)` to avoid a per-instance
+    `__dict__`. Events are then compared field by field by the generated `__eq__`.
     """
 
     timestamp: float
     metadata: typing.Optional[typing.Dict[str, typing.Any]]
 
+    # Set on events whose ``apply_to`` leaves the session untouched, so sessions
+    # can skip the call when appending them.
+    _is_noop: typing.ClassVar[bool] = False
+
     @abc.abstractmethod
     def apply_to(self, session: "Session") -> None:
         """
@@ -45,11 +55,3 @@ class Event(abc.ABC, JSONSerializableBase):
     def as_dict(self) -> typing.Dict[str, typing.Any]:
         """Convert the event to a dictionary format for serialization."""
         return JsonFormat.to_json(self)
-
-    def __eq__(self, other: typing.Any) -> bool:
-        """Compare two events for equality based on their dictionary representation."""
-        return isinstance(other, Event) and self.as_dict() == other.as_dict()
-
-    def __hash__(self) -> int:
-        """Generate a hash value for the event, used for storing events in sets or dicts."""
-        return hash(json.dumps(self.as_dict()))
@@ -1,7 +1,7 @@
 import abc
 import logging
 from collections import deque
-from copy import deepcopy
+import copy
 from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
 from tomo.shared.slots import Slot
@@ -41,7 +41,16 @@ class Session(abc.ABC):
         self.active = True
 
     def copy(self) -> "Session":
-        return deepcopy(self)
+        """Copy the session without copying its events.
+
+        Events are not modified once they are in the history and slot values are
+        replaced rather than mutated, so copying the containers and the slots is
+        enough for the copy to evolve separately.
+        """
+        session = copy.copy(self)
+        session.events = deque(self.events, maxlen=self.max_event_history)
+        session.slots = {name: copy.copy(slot) for name, slot in self.slots.items()}
+        return session
 
     def _reset(self) -> None:
         """
@@ -55,12 +64,16 @@ class Session(abc.ABC):
         self.active = True
 
     @abc.abstractmethod
-    async def update_with_event(self, event: "Event") -> "Session":
+    async def update_with_event(
+        self, event: "Event", immediate_persist: bool = True
+    ) -> "Session":
         """
         Update session by event, and the session should be persisted after updating.
 
         Args:
             event: An instance of an Event, such as a user utterance or bot action.
+            immediate_persist: If `False` the caller is responsible for saving the
+                session later on, e.g. with `update_with_events`.
         """
 
     @abc.abstractmethod
@@ -85,16 +98,18 @@ class Session(abc.ABC):
             slot.reset()
 
     def set_slot(self, key: str, value: Any) -> None:
-        slot: Slot = self.slots.get(key)
-        if slot is None:
-            logger.error("Slot setting failed, cannot find slot {key} from session.")
+        try:
+            slot: Slot = self.slots[key]
+        except KeyError:
+            logger.error("Slot setting failed, cannot find slot %s from session.", key)
             return
         slot.set_value(value)
 
     def unset_slot(self, key: str) -> None:
-        slot: Slot = self.slots.get(key)
-        if slot is None:
-            logger.error("Slot setting failed, cannot find slot {key} from session.")
+        try:
+            slot: Slot = self.slots[key]
+        except KeyError:
+            logger.error("Slot setting failed, cannot find slot %s from session.", key)
             return
         slot.reset()
 
@@ -12,10 +12,9 @@ def generate_action_instruction(action: Type[Action]):
         f"Action Name: {action.name}",
         f"Description: {action.description}",
     ]
-    required_slots = action.required_slots()
-    if required_slots is not None and len(required_slots) > 0:
+    if action.required_slots:
         instructions.append("Required Slots:")
-        for slot in required_slots:
+        for slot in action.required_slots:
             instructions.append(f"- {slot}")
 
     user_fields = fields(action)
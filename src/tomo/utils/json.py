@@ -1,23 +1,46 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Type, Union, get_type_hints
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple, Type, Union, get_type_hints
 
 JSON_SERIALIZABLE_KEY = "__JSON_SERIALIZABLE_KEY__"
 CLASS_REGISTRY: Dict[str, Type] = {}
 
 
+@lru_cache(maxsize=None)
+def _type_hints(cls: Type) -> Dict[str, Any]:
+    # Resolving the annotations is costly and classes don't change once registered
+    return get_type_hints(cls)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: Type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
+
+
 class JsonFormat:
     @staticmethod
     def to_json(instance: Optional[Any]) -> Dict[str, Any]:
         if instance is None:
             return None
-        if not hasattr(instance, "__dict__"):
+        if is_dataclass(instance):
+            # dataclasses declared with slots=True have no __dict__
+            attributes = [
+                (name, getattr(instance, name))
+                for name in _field_names(instance.__class__)
+            ]
+        elif hasattr(instance, "__dict__"):
+            attributes = instance.__dict__.items()
+        else:
             raise TypeError(
                 f"Object of type {type(instance).__name__} is not serializable"
             )
         data = {}
-        for attr_name, attr_value in instance.__dict__.items():
+        for attr_name, attr_value in attributes:
             if hasattr(attr_value, JSON_SERIALIZABLE_KEY):
                 attr_value = JsonFormat.to_json(attr_value)
+            elif isinstance(attr_value, MappingProxyType):
+                attr_value = dict(attr_value)
             elif isinstance(attr_value, list):
                 attr_value = [
                     JsonFormat.to_json(item)
@@ -41,7 +64,7 @@ class JsonFormat:
         cls = CLASS_REGISTRY.get(class_name)
         if not cls:
             raise ValueError(f"Unknown class: {class_name}")
-        type_hints = get_type_hints(cls)
+        type_hints = _type_hints(cls)
 
         def deserialize_value(value, field_type):
             if value is None:
@@ -59,6 +82,9 @@ class JsonFormat:
                 return [deserialize_value(item, item_type) for item in value]
             if hasattr(field_type, JSON_SERIALIZABLE_KEY):
                 return JsonFormat.from_json(value)
+            if isinstance(value, dict) and "_class" in value:
+                # Serializable object stored in an untyped field, e.g. a slot value
+                return JsonFormat.from_json(value)
             return value
 
         deserialized_data = {}
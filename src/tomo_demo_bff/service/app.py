@@ -69,6 +69,7 @@ def create_app(config_path: str) -> FastAPI:
     # Initialize services
     websocket_manager = WebSocketManager()
     tomo_service = TomoService(config_path)
+    app.add_event_handler("shutdown", tomo_service.close)
 
     # Custom OpenAPI schema
     app.openapi = lambda: custom_openapi(app)
@@ -60,6 +60,10 @@ class TomoService:
 
         logger.info("Tomo service initialized successfully")
 
+    async def close(self) -> None:
+        """Write the sessions still waiting to be saved"""
+        await self.session_manager.flush()
+
     async def handle_message(
         self, session_id: str, message_text: str
     ) -> List[Dict[str, Any]]:
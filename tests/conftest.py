@@ -0,0 +1,34 @@
+import time
+import types
+
+import pytest
+
+from tomo.core.events import BotUttered, UserUttered
+from tomo.shared.slots import Slot
+
+
+@pytest.fixture
+def assistant():
+    return types.SimpleNamespace(slots=[Slot(name="city", extractable=True)])
+
+
+@pytest.fixture
+def user_uttered():
+    def _user_uttered(text):
+        return UserUttered(
+            text=text,
+            message_id=None,
+            input_channel="test",
+            timestamp=time.time(),
+            metadata=None,
+        )
+
+    return _user_uttered
+
+
+@pytest.fixture
+def bot_uttered():
+    def _bot_uttered(text):
+        return BotUttered(text=text, timestamp=time.time(), metadata=None)
+
+    return _bot_uttered
@@ -0,0 +1,220 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from tomo.core.events import SlotSet
+from tomo.core.sessions import FileSessionManager, file_session
+from tomo.shared.exceptions import TomoException
+
+
+def _texts(session):
+    return [getattr(event, "text", None) for event in session.events]
+
+
+def test_session_is_reloaded_after_restart(
+    tmp_path, assistant, user_uttered, bot_uttered
+):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await session.update_with_events(
+            [
+                user_uttered("hello"),
+                SlotSet(key="city", value="Paris", timestamp=0, metadata=None),
+            ]
+        )
+        await session.update_with_event(bot_uttered("hi"))
+        await manager.flush()
+
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["hello", None, "hi"]
+    assert session.slots["city"].value == "Paris"
+    assert session.last_user_uttered_event().text == "hello"
+    assert session.has_bot_replied()
+
+
+def test_log_left_by_a_crash_is_not_replayed(
+    tmp_path, assistant, user_uttered, bot_uttered
+):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await manager.flush()
+        await session.update_with_event(user_uttered("hello"))
+        await session.update_with_event(bot_uttered("hi"))
+
+        # Crash after the session file is written but before the log is removed
+        log_path = tmp_path / "s1.json.events"
+        shutil.copy(log_path, tmp_path / "backup")
+        await manager.save(session)
+        await manager.flush()
+        assert not log_path.exists()
+        shutil.copy(tmp_path / "backup", log_path)
+
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await restarted.get_session("s1")
+        assert _texts(session) == ["hello", "hi"]
+
+        # Events appended after the stale ones are still replayed
+        await session.update_with_event(user_uttered("again"))
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["hello", "hi", "again"]
+
+
+def test_failed_write_is_raised_by_flush_and_retried(tmp_path, assistant, user_uttered):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await manager.flush()
+
+        # A directory in place of the session file makes the write fail
+        session_path = tmp_path / "s1.json"
+        os.remove(session_path)
+        os.mkdir(session_path)
+        await session.update_with_event(user_uttered("hello"), immediate_persist=False)
+        await manager.save(session)
+        for _ in range(2):
+            with pytest.raises(TomoException):
+                await manager.flush()
+
+        os.rmdir(session_path)
+        await manager.flush()
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["hello"]
+
+
+def test_sessions_match_the_storage_directory(tmp_path, assistant):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        other_worker = FileSessionManager(assistant, storage_path=tmp_path)
+        await manager.get_or_create_session("one")
+        await other_worker.get_or_create_session("two")
+        await manager.flush()
+        await other_worker.flush()
+        assert sorted(await manager.list_sessions()) == ["one", "two"]
+        assert (await manager.get_session_stats())["total_sessions"] == 2
+
+        os.utime(tmp_path / "two.json", (0, 0))
+        await manager.cleanup_old_sessions(max_age_days=1)
+        assert await manager.list_sessions() == ["one"]
+        assert await manager.get_session("two") is None
+
+    asyncio.run(run())
+
+
+def test_tracking_follows_the_bounded_history(
+    tmp_path, assistant, user_uttered, bot_uttered
+):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1", max_event_history=2)
+        await session.update_with_event(user_uttered("hello"))
+        await session.update_with_event(bot_uttered("hi"))
+        assert session.last_user_uttered_event().text == "hello"
+
+        # The user message falls out of the history
+        await session.update_with_event(bot_uttered("anything else?"))
+        assert session.last_user_uttered_event() is None
+        assert session.has_bot_replied()
+        assert [m["text"] for m in session.get_conversation_messages()] == [
+            "hi",
+            "anything else?",
+        ]
+
+        await session.update_with_event(user_uttered("bye"))
+        await session.update_with_event(
+            SlotSet(key="city", value="Paris", timestamp=0, metadata=None)
+        )
+        assert not session.has_bot_replied()
+        assert [m["text"] for m in session.get_conversation_messages()] == ["bye"]
+
+        # Restoring a history replaces what was tracked for the previous one
+        session.restore_events([bot_uttered("restored")])
+        assert session.last_user_uttered_event() is None
+        assert session.has_bot_replied()
+        assert [m["text"] for m in session.get_conversation_messages()] == ["restored"]
+
+    asyncio.run(run())
+
+
+def test_event_appended_during_a_write_is_saved(tmp_path, assistant, user_uttered):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await session.update_with_events([user_uttered("one")])
+        write_session_file = manager._write_session_file
+
+        async def write_with_event(file_path, session_data):
+            # The session is already serialized when the event arrives
+            manager._write_session_file = write_session_file
+            await session.update_with_event(user_uttered("two"))
+            await write_session_file(file_path, session_data)
+
+        manager._write_session_file = write_with_event
+        await manager.flush()
+        await manager.flush()
+
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["one", "two"]
+
+
+def test_record_cut_short_by_a_crash_is_skipped(tmp_path, assistant, user_uttered):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await manager.flush()
+        await session.update_with_event(user_uttered("hello"))
+        with open(tmp_path / "s1.json.events", "ab") as file:
+            file.write(b'{"position": 1, "ev')
+
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await restarted.get_or_create_session("s1")
+        assert _texts(session) == ["hello"]
+
+        # The log is still readable after the next append
+        await session.update_with_event(user_uttered("again"))
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["hello", "again"]
+
+
+def test_batches_are_appended_until_the_log_is_too_long(
+    tmp_path, monkeypatch, assistant, user_uttered, bot_uttered
+):
+    async def run():
+        manager = FileSessionManager(assistant, storage_path=tmp_path)
+        session = await manager.get_or_create_session("s1")
+        await manager.flush()
+        session_file = (tmp_path / "s1.json").read_bytes()
+
+        await session.update_with_events([user_uttered("hello"), bot_uttered("hi")])
+        await manager.flush()
+        assert (tmp_path / "s1.json").read_bytes() == session_file
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        assert _texts(await restarted.get_session("s1")) == ["hello", "hi"]
+
+        monkeypatch.setattr(file_session, "EVENTS_LOG_CHECKPOINT_SIZE", 0)
+        await session.update_with_events([user_uttered("bye")])
+        await manager.flush()
+        assert not (tmp_path / "s1.json.events").exists()
+        restarted = FileSessionManager(assistant, storage_path=tmp_path)
+        return await restarted.get_session("s1")
+
+    session = asyncio.run(run())
+    assert _texts(session) == ["hello", "hi", "bye"]
@@ -0,0 +1,48 @@
+import asyncio
+import types
+
+from tomo.core.actions import flight_exchange
+from tomo.core.actions._schemas import PnrDetails
+from tomo.core.sessions.in_memory_session import InMemorySessionManager
+from tomo.shared.slots import Slot
+
+
+class _OutputChannel:
+    async def send_text_message(self, text):
+        pass
+
+
+def test_pnr_details_are_fetched_again_after_a_change(monkeypatch):
+    reads = []
+
+    async def read_pnr(pnr_number):
+        reads.append(pnr_number)
+        return PnrDetails(pnr_number=pnr_number, status=f"read {len(reads)}")
+
+    monkeypatch.setattr(flight_exchange, "_read_pnr", read_pnr)
+    monkeypatch.setattr(flight_exchange, "_PNR_CACHE", {})
+
+    async def run():
+        assistant = types.SimpleNamespace(
+            slots=[
+                Slot(name="pnr_number", extractable=True),
+                Slot(name="pnr_details", extractable=False),
+            ]
+        )
+        session = await InMemorySessionManager(assistant).get_or_create_session("s1")
+        session.slots["pnr_number"].value = "ABC123"
+        output_channel = _OutputChannel()
+
+        for _ in range(2):
+            await session.update_with_events(
+                await flight_exchange.RetrievePNR().run(output_channel, session)
+            )
+        assert session.slots["pnr_details"].value.status == "read 1"
+
+        await flight_exchange.CancelExistingItinerary().run(output_channel, session)
+        await session.update_with_events(
+            await flight_exchange.RetrievePNR().run(output_channel, session)
+        )
+        assert session.slots["pnr_details"].value.status == "read 2"
+
+    asyncio.run(run())
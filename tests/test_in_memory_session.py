@@ -0,0 +1,24 @@
+import asyncio
+
+from tomo.core.sessions.in_memory_session import InMemorySessionManager
+
+
+def test_tracking_follows_the_bounded_history(assistant, user_uttered, bot_uttered):
+    async def run():
+        manager = InMemorySessionManager(assistant)
+        session = await manager.get_or_create_session("s1", max_event_history=2)
+        await session.update_with_events([user_uttered("hello"), bot_uttered("hi")])
+        assert session.last_user_uttered_event().text == "hello"
+        assert session.has_bot_replied()
+
+        # The user message falls out of the history
+        await session.update_with_event(bot_uttered("anything else?"))
+        assert session.last_user_uttered_event() is None
+        assert session.has_bot_replied()
+
+        await session.update_with_event(user_uttered("bye"))
+        await session.update_with_event(user_uttered("really"))
+        assert session.last_user_uttered_event().text == "really"
+        assert not session.has_bot_replied()
+
+    asyncio.run(run())
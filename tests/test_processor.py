@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+from tomo.core.processor import MessageProcessor
+from tomo.core.sessions.in_memory_session import InMemorySessionManager
+
+
+class _FailingPolicyManager:
+    async def run(self, session):
+        raise ValueError("policy failed")
+        yield  # pylint: disable=W0101
+
+
+def test_prediction_error_is_not_wrapped_in_a_group(assistant):
+    processor = MessageProcessor(
+        InMemorySessionManager(assistant), _FailingPolicyManager()
+    )
+
+    with pytest.raises(ValueError, match="policy failed"):
+        asyncio.run(processor._run_prediction_loop(None, "s1"))
+
+
+def test_session_lock_in_use_is_not_evicted(assistant):
+    async def run():
+        processor = MessageProcessor(
+            InMemorySessionManager(assistant), None, max_session_locks=2
+        )
+        with processor._use_session_lock("s1") as lock:
+            # Not acquired yet, the other sessions push it out of the bound
+            for session_id in ("s2", "s3", "s4"):
+                processor._get_session_lock(session_id)
+            assert processor._get_session_lock("s1") is lock
+
+        for session_id in ("s5", "s6"):
+            processor._get_session_lock(session_id)
+        assert "s1" not in processor._session_locks
+
+    asyncio.run(run())